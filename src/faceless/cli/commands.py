@@ -5,6 +5,7 @@ This module defines all CLI commands using Typer.
 """
 
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated
 
@@ -270,6 +271,13 @@ def generate(
 # =============================================================================
 
 
+def _test_azure_connection() -> bool:
+    """Create an Azure OpenAI client and run its connection test."""
+    from faceless.clients.azure_openai import AzureOpenAIClient
+
+    return AzureOpenAIClient().test_connection()
+
+
 @app.command()
 def validate(
     test_connections: Annotated[
@@ -341,42 +349,46 @@ def validate(
             "Not enabled (using Azure TTS)",
         )
 
-    # Check FFmpeg
-    import subprocess
+    # Start the API round trip first so it overlaps the local FFmpeg probe;
+    # the with block joins the worker even if the probe or output raises
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        connection_check: Future[bool] | None = None
+        if test_connections and azure_ok:
+            connection_check = executor.submit(_test_azure_connection)
+
+        # Check FFmpeg
+        import subprocess
+
+        try:
+            result = subprocess.run(
+                ["ffmpeg", "-version"],
+                capture_output=True,
+                timeout=5,
+            )
+            ffmpeg_ok = result.returncode == 0
+        except Exception:
+            ffmpeg_ok = False
 
-    try:
-        result = subprocess.run(
-            ["ffmpeg", "-version"],
-            capture_output=True,
-            timeout=5,
+        table.add_row(
+            "FFmpeg",
+            "[green]✓[/]" if ffmpeg_ok else "[red]✗[/]",
+            "Installed" if ffmpeg_ok else "Not found in PATH",
         )
-        ffmpeg_ok = result.returncode == 0
-    except Exception:
-        ffmpeg_ok = False
 
-    table.add_row(
-        "FFmpeg",
-        "[green]✓[/]" if ffmpeg_ok else "[red]✗[/]",
-        "Installed" if ffmpeg_ok else "Not found in PATH",
-    )
+        console.print(table)
 
-    console.print(table)
+        # Test connections if requested
+        if test_connections:
+            console.print("\n[bold]Testing API Connections...[/]")
 
-    # Test connections if requested
-    if test_connections:
-        console.print("\n[bold]Testing API Connections...[/]")
-
-        if azure_ok:
-            from faceless.clients.azure_openai import AzureOpenAIClient
-
-            try:
-                client = AzureOpenAIClient()
-                if client.test_connection():
-                    console.print("[green]✓[/] Azure OpenAI: Connected")
-                else:
-                    console.print("[red]✗[/] Azure OpenAI: Connection failed")
-            except Exception as e:
-                console.print(f"[red]✗[/] Azure OpenAI: {e}")
+            if connection_check is not None:
+                try:
+                    if connection_check.result():
+                        console.print("[green]✓[/] Azure OpenAI: Connected")
+                    else:
+                        console.print("[red]✗[/] Azure OpenAI: Connection failed")
+                except Exception as e:
+                    console.print(f"[red]✗[/] Azure OpenAI: {e}")
 
     # Summary
     all_ok = azure_ok and ffmpeg_ok
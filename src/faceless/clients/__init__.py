@@ -8,9 +8,10 @@ This module provides client classes for interacting with external services:
 """
 
 from faceless.clients.azure_openai import AzureOpenAIClient
-from faceless.clients.base import BaseHTTPClient
+from faceless.clients.base import BaseHTTPClient, SharedClient
 
 __all__ = [
     "BaseHTTPClient",
     "AzureOpenAIClient",
+    "SharedClient",
 ]
@@ -12,17 +12,103 @@ from pathlib import Path
 from typing import Any, cast
 
 import httpx
+from pydantic_core import from_json, to_json
+from tenacity import (
+    RetryCallState,
+    Retrying,
+    retry_if_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential,
+)
 
-from faceless.clients.base import BaseHTTPClient
+from faceless.clients.base import RETRY_MAX_WAIT, RETRY_MIN_WAIT, BaseHTTPClient
 from faceless.config import get_settings
 from faceless.core.enums import Niche, Platform, Voice
 from faceless.core.exceptions import (
     AzureOpenAIError,
     ContentFilterError,
     ImageGenerationError,
+    RateLimitError,
+    RequestTimeoutError,
     TTSGenerationError,
 )
 
+# Seconds allowed to establish a connection to Azure OpenAI
+CONNECT_TIMEOUT = 10.0
+
+# Bounds for the adaptive chat read timeout, in seconds
+MIN_CHAT_TIMEOUT = 30.0
+MAX_CHAT_TIMEOUT = 240.0
+
+# Extra attempts for chat requests that time out
+CHAT_TIMEOUT_RETRIES = 2
+
+# Transient statuses on which image and speech requests are resent
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+_MEDIA_BACKOFF = wait_exponential(min=RETRY_MIN_WAIT, max=RETRY_MAX_WAIT)
+
+
+def _is_transient_response(response: httpx.Response) -> bool:
+    """Check whether a response has a status worth retrying."""
+    return response.status_code in RETRYABLE_STATUSES
+
+
+def _media_retry_wait(retry_state: RetryCallState) -> float:
+    """Wait for a 429's Retry-After (capped), else back off exponentially."""
+    outcome = retry_state.outcome
+    if outcome is not None and outcome.failed:
+        error = outcome.exception()
+        if isinstance(error, RateLimitError) and error.retry_after:
+            return float(min(error.retry_after, RETRY_MAX_WAIT))
+    return _MEDIA_BACKOFF(retry_state)
+
+
+def _last_outcome(retry_state: RetryCallState) -> Any:
+    """Return the final attempt's response, or raise its error."""
+    if retry_state.outcome is None:
+        return None
+    return retry_state.outcome.result()
+
+
+def estimate_chat_timeout(prompt_chars: int, max_tokens: int) -> httpx.Timeout:
+    """
+    Estimate a timeout for a chat completion from its size.
+
+    Azure OpenAI latency grows with both prompt length and the number of
+    tokens generated, so small requests fail fast on a hung connection
+    while large ones are given room to finish.
+
+    Args:
+        prompt_chars: Total characters across all messages
+        max_tokens: Maximum tokens in the response
+
+    Returns:
+        Timeout with a short connect phase and a size-scaled read phase
+    """
+    read = MIN_CHAT_TIMEOUT + prompt_chars / 2000 + max_tokens / 50
+    return httpx.Timeout(min(MAX_CHAT_TIMEOUT, read), connect=CONNECT_TIMEOUT)
+
+
+# Shared by every JSON-mode request; only ever serialized, never mutated
+_JSON_OBJECT_FORMAT: dict[str, Any] = {"type": "json_object"}
+
+
+def _json_response_format(json_schema: dict[str, Any] | None) -> dict[str, Any]:
+    """Build a response_format for JSON mode or strict structured outputs."""
+    if json_schema is None:
+        return _JSON_OBJECT_FORMAT
+    return {"type": "json_schema", "json_schema": {**json_schema, "strict": True}}
+
+
+def _is_schema_unsupported(error: AzureOpenAIError) -> bool:
+    """Check whether a chat error is a 400 rejecting the json_schema format."""
+    message = error.message.lower()
+    return error.details.get("status_code") == 400 and (
+        "json_schema" in message or "response_format" in message
+    )
+
 
 class AzureOpenAIClient(BaseHTTPClient):
     """
@@ -60,6 +146,40 @@ class AzureOpenAIClient(BaseHTTPClient):
             },
         )
         self._settings = azure_settings
+        # A stalled TLS handshake fails fast instead of using the read budget
+        self._media_timeout = httpx.Timeout(self._timeout, connect=CONNECT_TIMEOUT)
+
+        # Deployment URLs are fixed for the client's lifetime; build them once
+        self._image_url = self._build_deployment_url(
+            deployment=azure_settings.image_deployment,
+            endpoint="images/generations",
+            api_version=azure_settings.image_api_version,
+        )
+        self._chat_url = self._build_deployment_url(
+            deployment=azure_settings.chat_deployment,
+            endpoint="chat/completions",
+            api_version=azure_settings.chat_api_version,
+        )
+        self._speech_url = self._build_deployment_url(
+            deployment=azure_settings.tts_deployment,
+            endpoint="audio/speech",
+            api_version=azure_settings.tts_api_version,
+        )
+        # DALL-E answers with a CDN URL unless asked for inline base64, which
+        # costs a second download; gpt-image models always inline and reject
+        # the response_format parameter
+        self._image_inline_format = azure_settings.image_deployment.startswith("dall-e")
+
+        # Deployments older than gpt-4o 2024-08-06 reject strict json_schema
+        # with a 400; after the first rejection, JSON calls use JSON mode
+        self._structured_outputs = True
+
+        # Running chat token totals; cached_tokens counts prompt-cache hits
+        self.token_usage: dict[str, int] = {
+            "prompt_tokens": 0,
+            "cached_tokens": 0,
+            "completion_tokens": 0,
+        }
 
     def _build_deployment_url(
         self,
@@ -116,6 +236,41 @@ class AzureOpenAIClient(BaseHTTPClient):
                 response_body=response.text[:500],
             )
 
+    def _post_media(self, url: str, payload: dict[str, Any]) -> httpx.Response:
+        """
+        POST an image or speech request, backing off on transient failures.
+
+        Throttling (429) and the statuses in RETRYABLE_STATUSES are retried
+        up to max_retries attempts when retries are enabled. Waits back off
+        exponentially, or follow Retry-After, capped at RETRY_MAX_WAIT. The
+        last response or error is returned or raised as-is.
+        """
+        retrying = Retrying(
+            stop=stop_after_attempt(self._max_retries if self._enable_retry else 1),
+            wait=_media_retry_wait,
+            retry=(
+                retry_if_exception_type(RateLimitError)
+                | retry_if_result(_is_transient_response)
+            ),
+            before_sleep=self._log_media_retry,
+            retry_error_callback=_last_outcome,
+        )
+        return retrying(self._post, url, json=payload, timeout=self._media_timeout)
+
+    def _log_media_retry(self, retry_state: RetryCallState) -> None:
+        """Log a transient image/speech failure before backing off."""
+        outcome = retry_state.outcome
+        if outcome is not None and not outcome.failed:
+            status = outcome.result().status_code
+        else:
+            status = 429
+        self.logger.warning(
+            "Transient API failure, retrying",
+            status_code=status,
+            attempt=retry_state.attempt_number,
+            delay=retry_state.next_action.sleep if retry_state.next_action else None,
+        )
+
     # =========================================================================
     # Image Generation
     # =========================================================================
@@ -143,18 +298,16 @@ class AzureOpenAIClient(BaseHTTPClient):
             ImageGenerationError: On generation failure
             ContentFilterError: If prompt is rejected by content filter
         """
-        url = self._build_deployment_url(
-            deployment=self._settings.image_deployment,
-            endpoint="images/generations",
-            api_version=self._settings.image_api_version,
-        )
+        url = self._image_url
 
-        payload = {
+        payload: dict[str, Any] = {
             "prompt": prompt,
             "size": size,
             "quality": quality,
             "n": n,
         }
+        if self._image_inline_format:
+            payload["response_format"] = "b64_json"
 
         self.logger.info(
             "Generating image",
@@ -164,7 +317,7 @@ class AzureOpenAIClient(BaseHTTPClient):
         )
 
         try:
-            response = self._post(url, json=payload)
+            response = self._post_media(url, payload)
 
             if response.status_code != 200:
                 self._handle_error_response(response, "Image generation")
@@ -179,15 +332,15 @@ class AzureOpenAIClient(BaseHTTPClient):
 
             image_data = result["data"][0]
 
-            # Handle URL or base64 response
-            if "url" in image_data:
+            # Handle base64 or URL response
+            if "b64_json" in image_data:
+                # Decode base64
+                return base64.b64decode(image_data["b64_json"])
+            elif "url" in image_data:
                 # Download from URL
                 img_response = self._client.get(image_data["url"])
                 img_response.raise_for_status()
                 return img_response.content
-            elif "b64_json" in image_data:
-                # Decode base64
-                return base64.b64decode(image_data["b64_json"])
             else:
                 raise ImageGenerationError(
                     message="Unexpected response format",
@@ -228,12 +381,113 @@ class AzureOpenAIClient(BaseHTTPClient):
     # Chat Completions
     # =========================================================================
 
+    def _build_chat_request(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        response_format: dict[str, Any] | None,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the URL and payload for a chat completion request."""
+        url = self._chat_url
+
+        payload: dict[str, Any] = {
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+
+        if response_format:
+            payload["response_format"] = response_format
+
+        return url, payload
+
+    def _post_chat(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        timeout: httpx.Timeout,
+    ) -> httpx.Response:
+        """POST a chat request, retrying immediately if it times out."""
+        # Serialized once, reused by every attempt
+        body = to_json(payload)
+        for attempt in range(CHAT_TIMEOUT_RETRIES):
+            try:
+                return self._post(url, content=body, timeout=timeout)
+            except RequestTimeoutError:
+                self.logger.warning(
+                    "Chat completion timed out, retrying",
+                    attempt=attempt + 1,
+                    timeout=timeout.read,
+                )
+        return self._post(url, content=body, timeout=timeout)
+
+    async def _apost_chat(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        timeout: httpx.Timeout,
+    ) -> httpx.Response:
+        """Async counterpart of _post_chat."""
+        body = to_json(payload)
+        for attempt in range(CHAT_TIMEOUT_RETRIES):
+            try:
+                return await self._apost(url, content=body, timeout=timeout)
+            except RequestTimeoutError:
+                self.logger.warning(
+                    "Chat completion timed out, retrying",
+                    attempt=attempt + 1,
+                    timeout=timeout.read,
+                )
+        return await self._apost(url, content=body, timeout=timeout)
+
+    def _parse_chat_response(
+        self,
+        response: httpx.Response,
+        usage: dict[str, Any] | None = None,
+    ) -> str:
+        """Extract the message content from a chat completion response."""
+        if response.status_code != 200:
+            self._handle_error_response(response, "Chat completion")
+
+        result = response.json()
+        self._record_usage(result.get("usage"))
+        if usage is not None:
+            usage.update(result.get("usage") or {})
+        content: str = result["choices"][0]["message"]["content"]
+        return content
+
+    def _record_usage(self, usage: dict[str, Any] | None) -> None:
+        """Log a response's token usage and add it to the running totals."""
+        if not usage:
+            return
+
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        details = usage.get("prompt_tokens_details") or {}
+        cached_tokens = details.get("cached_tokens", 0)
+        completion_tokens = usage.get("completion_tokens", 0)
+
+        self.token_usage["prompt_tokens"] += prompt_tokens
+        self.token_usage["cached_tokens"] += cached_tokens
+        self.token_usage["completion_tokens"] += completion_tokens
+
+        self.logger.info(
+            "Chat token usage",
+            prompt_tokens=prompt_tokens,
+            cached_tokens=cached_tokens,
+            completion_tokens=completion_tokens,
+            cache_hit_ratio=(
+                round(cached_tokens / prompt_tokens, 3) if prompt_tokens else 0.0
+            ),
+        )
+
     def chat(
         self,
         messages: list[dict[str, str]],
         temperature: float = 0.7,
         max_tokens: int = 4000,
-        response_format: dict[str, str] | None = None,
+        response_format: dict[str, Any] | None = None,
+        usage: dict[str, Any] | None = None,
     ) -> str:
         """
         Generate a chat completion.
@@ -243,6 +497,7 @@ class AzureOpenAIClient(BaseHTTPClient):
             temperature: Sampling temperature (0-2)
             max_tokens: Maximum tokens in response
             response_format: Optional format specification (e.g., {"type": "json_object"})
+            usage: Optional dict updated with the response's token usage
 
         Returns:
             Generated text response
@@ -250,36 +505,74 @@ class AzureOpenAIClient(BaseHTTPClient):
         Raises:
             AzureOpenAIError: On API failure
         """
-        url = self._build_deployment_url(
-            deployment=self._settings.chat_deployment,
-            endpoint="chat/completions",
-            api_version=self._settings.chat_api_version,
+        url, payload = self._build_chat_request(
+            messages, temperature, max_tokens, response_format
         )
 
-        payload: dict[str, Any] = {
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
-
-        if response_format:
-            payload["response_format"] = response_format
-
         self.logger.info(
             "Generating chat completion",
             message_count=len(messages),
             max_tokens=max_tokens,
         )
 
+        timeout = estimate_chat_timeout(
+            sum(len(m["content"]) for m in messages), max_tokens
+        )
+
         try:
-            response = self._post(url, json=payload)
+            response = self._post_chat(url, payload, timeout)
+            return self._parse_chat_response(response, usage)
 
-            if response.status_code != 200:
-                self._handle_error_response(response, "Chat completion")
+        except AzureOpenAIError:
+            raise
+        except Exception as e:
+            self.logger.error("Chat completion failed", error=str(e))
+            raise AzureOpenAIError(
+                message=f"Chat completion failed: {e}",
+            ) from e
 
-            result = response.json()
-            content: str = result["choices"][0]["message"]["content"]
-            return content
+    async def achat(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        response_format: dict[str, Any] | None = None,
+        usage: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Generate a chat completion asynchronously.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature (0-2)
+            max_tokens: Maximum tokens in response
+            response_format: Optional format specification
+            usage: Optional dict updated with the response's token usage
+
+        Returns:
+            Generated text response
+
+        Raises:
+            AzureOpenAIError: On API failure
+        """
+        url, payload = self._build_chat_request(
+            messages, temperature, max_tokens, response_format
+        )
+
+        self.logger.info(
+            "Generating chat completion",
+            message_count=len(messages),
+            max_tokens=max_tokens,
+            is_async=True,
+        )
+
+        timeout = estimate_chat_timeout(
+            sum(len(m["content"]) for m in messages), max_tokens
+        )
+
+        try:
+            response = await self._apost_chat(url, payload, timeout)
+            return self._parse_chat_response(response, usage)
 
         except AzureOpenAIError:
             raise
@@ -289,12 +582,22 @@ class AzureOpenAIClient(BaseHTTPClient):
                 message=f"Chat completion failed: {e}",
             ) from e
 
+    def _disable_structured_outputs(self, error: AzureOpenAIError) -> None:
+        """Fall back to plain JSON mode for the rest of the client's lifetime."""
+        self._structured_outputs = False
+        self.logger.warning(
+            "Deployment rejected json_schema, falling back to JSON mode",
+            error=error.message,
+        )
+
     def chat_json(
         self,
         system_prompt: str,
         user_prompt: str,
         temperature: float = 0.7,
         max_tokens: int = 4000,
+        json_schema: dict[str, Any] | None = None,
+        usage: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """
         Generate a chat completion with JSON response.
@@ -304,25 +607,96 @@ class AzureOpenAIClient(BaseHTTPClient):
             user_prompt: User message
             temperature: Sampling temperature
             max_tokens: Maximum tokens
+            json_schema: Optional named JSON schema for structured outputs
+                ({"name": ..., "schema": ...}); plain JSON mode if omitted or
+                if the deployment rejects structured outputs
+            usage: Optional dict updated with the response's token usage
 
         Returns:
             Parsed JSON response
         """
-        import json
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+
+        if not self._structured_outputs:
+            json_schema = None
+
+        try:
+            response_text = self.chat(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=_json_response_format(json_schema),
+                usage=usage,
+            )
+        except AzureOpenAIError as e:
+            if json_schema is None or not _is_schema_unsupported(e):
+                raise
+            self._disable_structured_outputs(e)
+            response_text = self.chat(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=_JSON_OBJECT_FORMAT,
+                usage=usage,
+            )
+
+        return cast(dict[str, Any], from_json(response_text))
+
+    async def achat_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        json_schema: dict[str, Any] | None = None,
+        usage: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Generate a chat completion with JSON response asynchronously.
+
+        Args:
+            system_prompt: System message
+            user_prompt: User message
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens
+            json_schema: Optional named JSON schema for structured outputs
+            usage: Optional dict updated with the response's token usage
 
+        Returns:
+            Parsed JSON response
+        """
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ]
 
-        response_text = self.chat(
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            response_format={"type": "json_object"},
-        )
+        if not self._structured_outputs:
+            json_schema = None
+
+        try:
+            response_text = await self.achat(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=_json_response_format(json_schema),
+                usage=usage,
+            )
+        except AzureOpenAIError as e:
+            if json_schema is None or not _is_schema_unsupported(e):
+                raise
+            self._disable_structured_outputs(e)
+            response_text = await self.achat(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=_JSON_OBJECT_FORMAT,
+                usage=usage,
+            )
 
-        return cast(dict[str, Any], json.loads(response_text))
+        return cast(dict[str, Any], from_json(response_text))
 
     # =========================================================================
     # Text-to-Speech
@@ -350,11 +724,7 @@ class AzureOpenAIClient(BaseHTTPClient):
         Raises:
             TTSGenerationError: On generation failure
         """
-        url = self._build_deployment_url(
-            deployment=self._settings.tts_deployment,
-            endpoint="audio/speech",
-            api_version=self._settings.tts_api_version,
-        )
+        url = self._speech_url
 
         payload = {
             "model": self._settings.tts_deployment,
@@ -372,7 +742,7 @@ class AzureOpenAIClient(BaseHTTPClient):
         )
 
         try:
-            response = self._post(url, json=payload)
+            response = self._post_media(url, payload)
 
             if response.status_code != 200:
                 self._handle_error_response(response, "TTS generation")
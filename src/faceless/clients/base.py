@@ -5,6 +5,7 @@ This module provides a base class for all HTTP clients in the application,
 implementing common patterns like retries, timeouts, and structured logging.
 """
 
+import threading
 from collections.abc import Callable
 from typing import Any, TypeVar, cast
 
@@ -18,11 +19,25 @@ from tenacity import (
 )
 
 from faceless.config import get_settings
-from faceless.core.exceptions import ClientError, RateLimitError
+from faceless.core.exceptions import ClientError, RateLimitError, RequestTimeoutError
 from faceless.utils.logging import LoggerMixin
 
 T = TypeVar("T")
 
+# Connection pool shared by each client's requests. Idle connections are kept
+# for a minute so sequential API calls reuse a warm TLS connection instead of
+# handshaking again after httpx's 5 second default. Passed as limits= rather
+# than through a custom transport, which would disable HTTP(S)_PROXY support.
+POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=32,
+    keepalive_expiry=60.0,
+)
+
+# Exponential backoff bounds between retry attempts, in seconds
+RETRY_MIN_WAIT = 1.0
+RETRY_MAX_WAIT = 60.0
+
 
 class BaseHTTPClient(LoggerMixin):
     """
@@ -66,18 +81,45 @@ class BaseHTTPClient(LoggerMixin):
             base_url=self._base_url,
             timeout=httpx.Timeout(self._timeout),
             headers=self._default_headers,
+            limits=POOL_LIMITS,
         )
 
+        # Async client is created on first use so it binds to the running loop
+        self._async_client: httpx.AsyncClient | None = None
+
     def close(self) -> None:
         """Close the HTTP client and release resources."""
         self._client.close()
 
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the async HTTP client, creating it on first use."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                base_url=self._base_url,
+                timeout=httpx.Timeout(self._timeout),
+                headers=self._default_headers,
+                limits=POOL_LIMITS,
+            )
+        return self._async_client
+
     def __enter__(self) -> "BaseHTTPClient":
         return self
 
     def __exit__(self, *args: Any) -> None:
         self.close()
 
+    def _read_timeout(self, timeout: httpx.Timeout | float | None) -> float | None:
+        """Get the read timeout in effect for a request."""
+        if isinstance(timeout, httpx.Timeout):
+            return timeout.read
+        return timeout or self._timeout
+
     def _build_url(self, path: str) -> str:
         """Build full URL from path."""
         if path.startswith("http"):
@@ -106,6 +148,50 @@ class BaseHTTPClient(LoggerMixin):
             RateLimitError: On rate limit (429) response
         """
         url = self._build_url(path)
+        self._log_request(method, url, kwargs)
+
+        try:
+            response = self._client.request(method, path, **kwargs)
+        except httpx.RequestError as e:
+            raise self._request_error(url, e, kwargs.get("timeout")) from e
+
+        return self._check_response(method, url, response)
+
+    async def _arequest(
+        self,
+        method: str,
+        path: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Make an async HTTP request.
+
+        Async counterpart of _request with the same error handling.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: URL path
+            **kwargs: Additional arguments for httpx.AsyncClient.request
+
+        Returns:
+            httpx.Response object
+
+        Raises:
+            ClientError: On request failure
+            RateLimitError: On rate limit (429) response
+        """
+        url = self._build_url(path)
+        self._log_request(method, url, kwargs)
+
+        try:
+            response = await self._get_async_client().request(method, path, **kwargs)
+        except httpx.RequestError as e:
+            raise self._request_error(url, e, kwargs.get("timeout")) from e
+
+        return self._check_response(method, url, response)
+
+    def _log_request(self, method: str, url: str, kwargs: dict[str, Any]) -> None:
+        """Log an outgoing request without its body."""
         self.logger.debug(
             "HTTP request",
             method=method,
@@ -114,36 +200,49 @@ class BaseHTTPClient(LoggerMixin):
             has_data="data" in kwargs,
         )
 
-        try:
-            response = self._client.request(method, path, **kwargs)
+    def _check_response(
+        self,
+        method: str,
+        url: str,
+        response: httpx.Response,
+    ) -> httpx.Response:
+        """Log a response and raise RateLimitError on a 429."""
+        self.logger.debug(
+            "HTTP response",
+            method=method,
+            url=url,
+            status_code=response.status_code,
+            content_length=len(response.content),
+        )
 
-            # Log response
-            self.logger.debug(
-                "HTTP response",
-                method=method,
-                url=url,
-                status_code=response.status_code,
-                content_length=len(response.content),
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            raise RateLimitError(
+                message="Rate limit exceeded",
+                retry_after=int(retry_after) if retry_after else None,
+                service=self.__class__.__name__,
             )
 
-            # Check for rate limiting
-            if response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
-                raise RateLimitError(
-                    message="Rate limit exceeded",
-                    retry_after=int(retry_after) if retry_after else None,
-                    service=self.__class__.__name__,
-                )
-
-            return response
+        return response
 
-        except httpx.TimeoutException as e:
-            self.logger.error("Request timeout", url=url, timeout=self._timeout)
-            raise ClientError(f"Request timeout: {url}") from e
-
-        except httpx.RequestError as e:
-            self.logger.error("Request failed", url=url, error=str(e))
-            raise ClientError(f"Request failed: {e}") from e
+    def _request_error(
+        self,
+        url: str,
+        error: httpx.RequestError,
+        timeout: httpx.Timeout | float | None,
+    ) -> ClientError:
+        """Log a transport failure and convert it to a ClientError."""
+        if isinstance(error, httpx.TimeoutException):
+            read_timeout = self._read_timeout(timeout)
+            self.logger.error("Request timeout", url=url, timeout=read_timeout)
+            return RequestTimeoutError(f"Request timeout: {url}", timeout=read_timeout)
+
+        self.logger.error("Request failed", url=url, error=str(error))
+        return ClientError(f"Request failed: {error}")
+
+    async def _apost(self, path: str, **kwargs: Any) -> httpx.Response:
+        """Make an async POST request."""
+        return await self._arequest("POST", path, **kwargs)
 
     def _get(self, path: str, **kwargs: Any) -> httpx.Response:
         """Make a GET request."""
@@ -219,10 +318,56 @@ class BaseHTTPClient(LoggerMixin):
         return response.content
 
 
+class SharedClient:
+    """
+    Lazily created httpx.Client shared across calls and threads.
+
+    For module-level functions that make plain HTTP requests without an API
+    client object. One keep-alive pool is reused, so successive requests
+    skip the TCP and TLS handshake.
+
+    Example:
+        >>> _get_client = SharedClient(timeout=30.0).get
+        >>> _get_client().get(url)
+    """
+
+    def __init__(
+        self,
+        timeout: float,
+        headers: dict[str, str] | None = None,
+        max_connections: int = 8,
+    ) -> None:
+        """
+        Configure the client without creating it.
+
+        Args:
+            timeout: Default request timeout in seconds
+            headers: Default headers for all requests
+            max_connections: Connection pool size
+        """
+        self._timeout = timeout
+        self._headers = headers or {}
+        self._limits = httpx.Limits(max_connections=max_connections)
+        self._client: httpx.Client | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> httpx.Client:
+        """Return the shared client, creating it on first use."""
+        with self._lock:
+            if self._client is None:
+                # limits= rather than a custom transport keeps env proxy support
+                self._client = httpx.Client(
+                    timeout=self._timeout,
+                    headers=self._headers,
+                    limits=self._limits,
+                )
+            return self._client
+
+
 def with_retry(
     max_attempts: int = 3,
-    min_wait: float = 1.0,
-    max_wait: float = 60.0,
+    min_wait: float = RETRY_MIN_WAIT,
+    max_wait: float = RETRY_MAX_WAIT,
     retry_exceptions: tuple[type[Exception], ...] = (
         httpx.TimeoutException,
         httpx.NetworkError,
@@ -377,6 +377,14 @@ class Settings(BaseSettings):
         default=Path("shared"),
         description="Directory for shared resources",
     )
+    enhance_cache_dir: Path | None = Field(
+        default=None,
+        description="Directory for persisted script enhancement results (off if unset)",
+    )
+    tts_cache_dir: Path | None = Field(
+        default=None,
+        description="Directory for content-addressed narration audio (off if unset)",
+    )
 
     # FFmpeg paths (empty string means use system PATH)
     ffmpeg_path: str = Field(
@@ -404,6 +412,12 @@ class Settings(BaseSettings):
         le=20,
         description="Maximum concurrent API requests (general)",
     )
+    max_concurrent_enhancements: int = Field(
+        default=8,
+        ge=1,
+        le=32,
+        description="Maximum concurrent script enhancement (chat) requests",
+    )
     max_concurrent_images: int = Field(
         default=10,
         ge=1,
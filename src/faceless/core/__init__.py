@@ -71,7 +71,9 @@ from faceless.core.text_overlay import (
     create_mid_video_overlay,
     create_pov_overlay,
     generate_overlay_filter_chain,
+    generate_overlay_subtitles_filter,
     overlay_to_ffmpeg_filter,
+    overlays_to_ass,
     position_to_xy,
 )
 from faceless.core.tiktok_formats import (
@@ -163,4 +165,6 @@ __all__ = [
     "position_to_xy",
     "overlay_to_ffmpeg_filter",
     "generate_overlay_filter_chain",
+    "overlays_to_ass",
+    "generate_overlay_subtitles_filter",
 ]
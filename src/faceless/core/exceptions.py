@@ -21,7 +21,8 @@ Exception Hierarchy:
     ├── ClientError
     │   ├── AzureOpenAIError
     │   ├── ElevenLabsError
-    │   └── RedditError
+    │   ├── RedditError
+    │   └── RequestTimeoutError
     └── ExternalToolError
         └── FFmpegError
 """
@@ -370,6 +371,26 @@ class RedditError(ClientError):
         super().__init__(message, details=details)
 
 
+class RequestTimeoutError(ClientError):
+    """
+    Raised when an HTTP request times out.
+
+    Attributes:
+        timeout: The timeout that was exceeded, in seconds.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        timeout: float | None = None,
+    ) -> None:
+        details: dict[str, Any] = {}
+        if timeout:
+            details["timeout"] = timeout
+        super().__init__(message, details=details)
+        self.timeout = timeout
+
+
 # =============================================================================
 # External Tool Errors
 # =============================================================================
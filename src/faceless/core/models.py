@@ -194,11 +194,7 @@ class Script(BaseModel):
     @classmethod
     def from_json_file(cls, path: Path) -> "Script":
         """Load script from a JSON file."""
-        with open(path, encoding="utf-8") as f:
-            import json
-
-            data = json.load(f)
-        return cls.model_validate(data)
+        return cls.model_validate_json(path.read_bytes())
 
 
 # =============================================================================
@@ -376,11 +372,7 @@ class Checkpoint(BaseModel):
     @classmethod
     def load(cls, path: Path) -> "Checkpoint":
         """Load checkpoint from file."""
-        with open(path, encoding="utf-8") as f:
-            import json
-
-            data = json.load(f)
-        return cls.model_validate(data)
+        return cls.model_validate_json(path.read_bytes())
 
 
 # =============================================================================
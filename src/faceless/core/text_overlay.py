@@ -8,13 +8,17 @@ Designed for FFmpeg subtitle/text filter integration
 """
 
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, unique
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
 
 from faceless.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@unique
 class TextPosition(Enum):
     """Text overlay position presets."""
 
@@ -42,7 +46,7 @@ class TextAnimation(Enum):
     SLIDE_DOWN = "slide_down"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TextStyle:
     """Text styling configuration."""
 
@@ -55,12 +59,12 @@ class TextStyle:
     outline_width: int = 3
     shadow: bool = True
     shadow_color: str = "black"
-    shadow_offset: tuple = (2, 2)
+    shadow_offset: tuple[int, int] = (2, 2)
     background_color: str | None = None
     background_padding: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class TextOverlay:
     """Represents a text overlay to be rendered on video."""
 
@@ -251,21 +255,20 @@ def create_countdown_overlays(
     Returns:
         List of TextOverlay objects for countdown
     """
-    overlays = []
-
-    for i in range(count_from, 0, -1):
-        overlays.append(
-            TextOverlay(
-                text=str(i),
-                position=TextPosition.CENTER,
-                start_time=start_at_seconds + (count_from - i),
-                end_time=start_at_seconds + (count_from - i) + 0.9,
-                style=PRESET_STYLES["countdown"],
-                animation=TextAnimation.SCALE_IN,
-            )
+    style = PRESET_STYLES["countdown"]
+
+    # Step k shows the number count_from - k for 0.9s starting k seconds in
+    return [
+        TextOverlay(
+            text=str(count_from - k),
+            position=TextPosition.CENTER,
+            start_time=start_at_seconds + k,
+            end_time=start_at_seconds + k + 0.9,
+            style=style,
+            animation=TextAnimation.SCALE_IN,
         )
-
-    return overlays
+        for k in range(count_from)
+    ]
 
 
 def create_pov_overlay(
@@ -307,6 +310,48 @@ def create_pov_overlay(
 # =============================================================================
 
 
+_BY_LAYER = attrgetter("layer")
+
+
+@lru_cache(maxsize=64)
+def _style_fragment(style: TextStyle) -> str:
+    """
+    Build the drawtext options that depend only on the text style.
+
+    TextStyle is frozen and hashable, and overlays nearly always share a
+    preset, so each style's options are built once.
+    """
+    fragment = f"fontsize={style.font_size}:fontcolor={style.font_color}"
+
+    # Add outline/border
+    if style.outline_width > 0:
+        fragment += f":borderw={style.outline_width}:bordercolor={style.outline_color}"
+
+    # Add shadow
+    if style.shadow:
+        fragment += (
+            f":shadowcolor={style.shadow_color}"
+            f":shadowx={style.shadow_offset[0]}:shadowy={style.shadow_offset[1]}"
+        )
+
+    return fragment
+
+
+_CENTER_XY = ("(w-text_w)/2", "(h-text_h)/2")
+
+_POSITION_EXPRS: dict[TextPosition, tuple[str, str]] = {
+    TextPosition.TOP_LEFT: ("10", "10"),
+    TextPosition.TOP_CENTER: ("(w-text_w)/2", "50"),
+    TextPosition.TOP_RIGHT: ("w-text_w-10", "10"),
+    TextPosition.CENTER_LEFT: ("10", "(h-text_h)/2"),
+    TextPosition.CENTER: _CENTER_XY,
+    TextPosition.CENTER_RIGHT: ("w-text_w-10", "(h-text_h)/2"),
+    TextPosition.BOTTOM_LEFT: ("10", "h-text_h-100"),
+    TextPosition.BOTTOM_CENTER: ("(w-text_w)/2", "h-text_h-100"),
+    TextPosition.BOTTOM_RIGHT: ("w-text_w-10", "h-text_h-100"),
+}
+
+
 def position_to_xy(
     position: TextPosition, video_width: int = 1080, video_height: int = 1920
 ) -> tuple:
@@ -321,19 +366,7 @@ def position_to_xy(
     Returns:
         Tuple of (x_expr, y_expr) for FFmpeg drawtext filter
     """
-    positions = {
-        TextPosition.TOP_LEFT: ("10", "10"),
-        TextPosition.TOP_CENTER: ("(w-text_w)/2", "50"),
-        TextPosition.TOP_RIGHT: ("w-text_w-10", "10"),
-        TextPosition.CENTER_LEFT: ("10", "(h-text_h)/2"),
-        TextPosition.CENTER: ("(w-text_w)/2", "(h-text_h)/2"),
-        TextPosition.CENTER_RIGHT: ("w-text_w-10", "(h-text_h)/2"),
-        TextPosition.BOTTOM_LEFT: ("10", "h-text_h-100"),
-        TextPosition.BOTTOM_CENTER: ("(w-text_w)/2", "h-text_h-100"),
-        TextPosition.BOTTOM_RIGHT: ("w-text_w-10", "h-text_h-100"),
-    }
-
-    return positions.get(position, ("(w-text_w)/2", "(h-text_h)/2"))
+    return _POSITION_EXPRS.get(position, _CENTER_XY)
 
 
 def overlay_to_ffmpeg_filter(
@@ -355,34 +388,16 @@ def overlay_to_ffmpeg_filter(
     # Escape special characters in text
     escaped_text = overlay.text.replace("'", "'\\''").replace(":", "\\:")
 
-    # Build filter components
-    filter_parts = [
-        f"drawtext=text='{escaped_text}'",
-        f"fontsize={overlay.style.font_size}",
-        f"fontcolor={overlay.style.font_color}",
-        f"x={x_expr}",
-        f"y={y_expr}",
-    ]
-
-    # Add outline/border
-    if overlay.style.outline_width > 0:
-        filter_parts.append(f"borderw={overlay.style.outline_width}")
-        filter_parts.append(f"bordercolor={overlay.style.outline_color}")
-
-    # Add shadow
-    if overlay.style.shadow:
-        filter_parts.append(f"shadowcolor={overlay.style.shadow_color}")
-        filter_parts.append(f"shadowx={overlay.style.shadow_offset[0]}")
-        filter_parts.append(f"shadowy={overlay.style.shadow_offset[1]}")
-
-    # Add timing
-    filter_parts.append(f"enable='between(t,{overlay.start_time},{overlay.end_time})'")
+    style_options = _style_fragment(overlay.style)
 
     # Note: Fade animations would require complex filter graphs with alpha channels
     # This is a placeholder for future implementation
     _ = overlay.animation  # Acknowledge animation parameter for future use
 
-    return ":".join(filter_parts)
+    return (
+        f"drawtext=text='{escaped_text}':{style_options}:x={x_expr}:y={y_expr}"
+        f":enable='between(t,{overlay.start_time},{overlay.end_time})'"
+    )
 
 
 def generate_overlay_filter_chain(
@@ -403,7 +418,7 @@ def generate_overlay_filter_chain(
         return ""
 
     # Sort by layer for proper z-ordering
-    sorted_overlays = sorted(overlays, key=lambda o: o.layer)
+    sorted_overlays = sorted(overlays, key=_BY_LAYER)
 
     filters = [
         overlay_to_ffmpeg_filter(o, video_width, video_height) for o in sorted_overlays
@@ -412,6 +427,178 @@ def generate_overlay_filter_chain(
     return ",".join(filters)
 
 
+# =============================================================================
+# ASS SUBTITLE GENERATION
+# =============================================================================
+
+# libass numpad alignment and vertical margin matching position_to_xy
+_ASS_ALIGNMENT: dict[TextPosition, tuple[int, int]] = {
+    TextPosition.TOP_LEFT: (7, 10),
+    TextPosition.TOP_CENTER: (8, 50),
+    TextPosition.TOP_RIGHT: (9, 10),
+    TextPosition.CENTER_LEFT: (4, 0),
+    TextPosition.CENTER: (5, 0),
+    TextPosition.CENTER_RIGHT: (6, 0),
+    TextPosition.BOTTOM_LEFT: (1, 100),
+    TextPosition.BOTTOM_CENTER: (2, 100),
+    TextPosition.BOTTOM_RIGHT: (3, 100),
+}
+
+_ASS_NAMED_COLOURS = {"white": "FFFFFF", "black": "000000", "red": "FF0000"}
+
+_ASS_HEADER = """[Script Info]
+ScriptType: v4.00+
+PlayResX: {width}
+PlayResY: {height}
+ScaledBorderAndShadow: yes
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, \
+BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, \
+BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+"""
+
+_ASS_EVENTS_HEADER = """
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+"""
+
+
+def _ass_colour(color: str) -> str:
+    """Convert a named, #RRGGBB or rgba() color to ASS &HAABBGGRR form."""
+    color = color.strip().lower()
+    alpha = 0
+    if color.startswith("rgba(") and color.endswith(")"):
+        r, g, b, a = (part.strip() for part in color[5:-1].split(","))
+        rgb = f"{int(r):02X}{int(g):02X}{int(b):02X}"
+        alpha = round((1 - float(a)) * 255)
+    elif color.startswith("#") and len(color) == 7:
+        rgb = color[1:].upper()
+    else:
+        rgb = _ASS_NAMED_COLOURS.get(color, "FFFFFF")
+    return f"&H{alpha:02X}{rgb[4:6]}{rgb[2:4]}{rgb[0:2]}"
+
+
+def _ass_timestamp(seconds: float) -> str:
+    """Format seconds as an ASS H:MM:SS.cc timestamp."""
+    centis = round(max(seconds, 0.0) * 100)
+    minutes, centis = divmod(centis, 6000)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{centis // 100:02d}.{centis % 100:02d}"
+
+
+def _ass_escape(text: str) -> str:
+    """Escape text for a Dialogue event so libass renders it literally."""
+    # Backslash first, so the escapes added after it are not doubled
+    return (
+        text.replace("\\", "\\\\")
+        .replace("{", "\\{")
+        .replace("}", "\\}")
+        .replace("\n", "\\N")
+    )
+
+
+def _ass_style_line(name: str, style: TextStyle) -> str:
+    """Build a V4+ Style line for a TextStyle."""
+    boxed = style.background_color is not None
+    shadow_depth = style.shadow_offset[0] if style.shadow else 0
+    back_colour = _ass_colour(style.background_color or style.shadow_color)
+    return (
+        f"Style: {name},{style.font_family},{style.font_size},"
+        f"{_ass_colour(style.font_color)},&H000000FF,"
+        f"{_ass_colour(style.outline_color)},{back_colour},"
+        f"{-1 if style.bold else 0},{-1 if style.italic else 0},0,0,100,100,0,0,"
+        f"{3 if boxed else 1},"
+        f"{style.background_padding if boxed else style.outline_width},"
+        f"{shadow_depth},5,10,10,0,1"
+    )
+
+
+def overlays_to_ass(
+    overlays: list[TextOverlay], video_width: int = 1080, video_height: int = 1920
+) -> str:
+    """
+    Convert text overlays to an ASS subtitle document.
+
+    Each distinct TextStyle becomes one V4+ style and each overlay one
+    Dialogue event, positioned with an alignment override. Unlike a chain
+    of drawtext filters, libass only renders the events active on a frame.
+
+    Args:
+        overlays: List of TextOverlay objects
+        video_width: Video width
+        video_height: Video height
+
+    Returns:
+        ASS document text
+    """
+    style_names: dict[TextStyle, str] = {}
+    style_lines: list[str] = []
+    events: list[str] = []
+
+    for overlay in sorted(overlays, key=_BY_LAYER):
+        name = style_names.get(overlay.style)
+        if name is None:
+            name = f"Overlay{len(style_names) + 1}"
+            style_names[overlay.style] = name
+            style_lines.append(_ass_style_line(name, overlay.style))
+
+        alignment, margin_v = _ASS_ALIGNMENT.get(overlay.position, (5, 0))
+        text = _ass_escape(overlay.text)
+        events.append(
+            f"Dialogue: {overlay.layer},{_ass_timestamp(overlay.start_time)},"
+            f"{_ass_timestamp(overlay.end_time)},{name},,0,0,{margin_v},,"
+            f"{{\\an{alignment}}}{text}"
+        )
+
+    header = _ASS_HEADER.format(width=video_width, height=video_height)
+    return (
+        header
+        + "\n".join(style_lines)
+        + "\n"
+        + _ASS_EVENTS_HEADER
+        + "\n".join(events)
+        + "\n"
+    )
+
+
+def generate_overlay_subtitles_filter(
+    overlays: list[TextOverlay],
+    ass_path: Path,
+    video_width: int = 1080,
+    video_height: int = 1920,
+) -> str:
+    """
+    Generate an FFmpeg filter rendering all overlays from one ASS file.
+
+    A single overlay is cheaper as a drawtext filter, so it is returned as
+    one and no file is written.
+
+    Args:
+        overlays: List of TextOverlay objects
+        ass_path: Where to write the ASS file
+        video_width: Video width
+        video_height: Video height
+
+    Returns:
+        FFmpeg subtitles (or drawtext) filter string
+    """
+    if not overlays:
+        return ""
+    if len(overlays) == 1:
+        return overlay_to_ffmpeg_filter(overlays[0], video_width, video_height)
+
+    ass_path.parent.mkdir(parents=True, exist_ok=True)
+    ass_path.write_text(
+        overlays_to_ass(overlays, video_width, video_height), encoding="utf-8"
+    )
+
+    safe_path = (
+        str(ass_path).replace("\\", "/").replace(":", "\\:").replace("'", "'\\''")
+    )
+    return f"subtitles='{safe_path}'"
+
+
 # =============================================================================
 # STANDALONE USAGE
 # =============================================================================
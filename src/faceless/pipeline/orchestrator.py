@@ -109,6 +109,11 @@ class Orchestrator(LoggerMixin):
             self.logger.warning("No scripts found to process")
             return results
 
+        # Enhance multiple scripts concurrently rather than one per iteration
+        if enhance and len(scripts) > 1:
+            scripts = self._enhance_scripts(scripts)
+            enhance = False
+
         # Process each script
         for i, script in enumerate(scripts):
             self.logger.info(
@@ -139,6 +144,29 @@ class Orchestrator(LoggerMixin):
 
         return results
 
+    def _enhance_scripts(self, scripts: list[Script]) -> list[Script]:
+        """Enhance all scripts not yet enhanced per their checkpoints."""
+        checkpoints = [self._load_or_create_checkpoint(s) for s in scripts]
+        pending = [
+            i
+            for i, checkpoint in enumerate(checkpoints)
+            if "enhance" not in checkpoint.completed_steps
+        ]
+        if not pending:
+            return scripts
+
+        self.logger.info("Starting batch script enhancement...", count=len(pending))
+        enhanced = self._enhancer_service.enhance_scripts([scripts[i] for i in pending])
+
+        result = list(scripts)
+        for i, script in zip(pending, enhanced, strict=True):
+            checkpoints[i].completed_steps.append("enhance")
+            self._save_checkpoint(checkpoints[i], script)
+            result[i] = script
+
+        self.logger.info("Batch script enhancement completed", count=len(pending))
+        return result
+
     def _load_existing_scripts(self, niche: Niche, count: int) -> list[Script]:
         """Load existing scripts from the scripts directory."""
         scripts_dir = self._settings.get_scripts_dir(niche)
@@ -5,10 +5,21 @@ This service uses GPT to enhance scripts for better engagement,
 including improved narration, image prompts, and visual consistency.
 """
 
+import asyncio
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
 from faceless.clients.azure_openai import AzureOpenAIClient
 from faceless.config import get_settings
+from faceless.core.enums import Niche
 from faceless.core.models import Scene, Script, VisualStyle
 from faceless.utils.logging import LoggerMixin
 
@@ -22,7 +33,320 @@ Guidelines:
 4. Keep scenes concise for short-form content
 5. Add visual style consistency across scenes
 
-Output format: Valid JSON matching the script structure."""
+Output format: Valid JSON with title and scenes (scene_number, narration, image_prompt)."""
+
+# JSON schema for a VisualStyle. recurring_elements is a list of name/description
+# pairs because strict structured outputs do not allow free-form object keys.
+VISUAL_STYLE_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "environment": {
+            "type": "string",
+            "description": "Consistent environment description",
+        },
+        "color_mood": {"type": "string", "description": "Color palette and mood"},
+        "texture": {"type": "string", "description": "Surface and material details"},
+        "recurring_elements": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "description": {"type": "string"},
+                },
+                "required": ["name", "description"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["environment", "color_mood", "texture", "recurring_elements"],
+    "additionalProperties": False,
+}
+
+# Structured output schemas. Both share VISUAL_STYLE_SCHEMA so the visual
+# style spec is defined once rather than as inline JSON examples per prompt.
+GENERATED_VISUAL_STYLE_SCHEMA: dict[str, Any] = {
+    "name": "visual_style",
+    "schema": VISUAL_STYLE_SCHEMA,
+}
+
+ENHANCED_SCRIPT_SCHEMA: dict[str, Any] = {
+    "name": "enhanced_script",
+    "schema": {
+        "type": "object",
+        "properties": {
+            "title": {"type": "string"},
+            "visual_style": VISUAL_STYLE_SCHEMA,
+            "scenes": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "scene_number": {"type": "integer"},
+                        "narration": {"type": "string"},
+                        "image_prompt": {"type": "string"},
+                    },
+                    "required": ["scene_number", "narration", "image_prompt"],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["title", "visual_style", "scenes"],
+        "additionalProperties": False,
+    },
+}
+
+
+class _EnhancedSceneData(BaseModel):
+    """Shape check for one scene of an ENHANCED_SCRIPT_SCHEMA response."""
+
+    scene_number: int
+    narration: str
+    image_prompt: str
+
+
+class _EnhancementResponse(BaseModel):
+    """
+    Shape check for an ENHANCED_SCRIPT_SCHEMA response.
+
+    The validator is compiled once with the class. Fields the merge falls
+    back on are optional, so only malformed values are rejected.
+    """
+
+    title: str | None = None
+    scenes: list[_EnhancedSceneData] = []
+    visual_style: dict[str, Any] | None = None
+
+
+# Identifies the system prompt and output schema that produced a cached
+# enhancement; persisted results are scoped by it, so editing either one
+# invalidates them without a manual version bump
+_PROMPT_FINGERPRINT = hashlib.blake2b(
+    ENHANCE_SYSTEM_PROMPT.encode("utf-8") + to_json(ENHANCED_SCRIPT_SCHEMA),
+    digest_size=8,
+).hexdigest()
+
+# Output token budget for enhancement: a fixed allowance for the title and
+# visual style, plus room for every scene to roughly double in length
+ENHANCE_BASE_TOKENS = 400
+ENHANCE_TOKENS_PER_SCENE = 30
+ENHANCE_MAX_TOKENS = 4000
+
+
+def _enhancement_max_tokens(script: Script) -> int:
+    """
+    Cap enhancement output tokens by the size of the script being enhanced.
+
+    At ~4 characters per token, chars // 2 allows each scene's text to double;
+    ENHANCE_TOKENS_PER_SCENE covers the JSON keys around it.
+    """
+    scene_chars = sum(len(s.narration) + len(s.image_prompt) for s in script.scenes)
+    estimate = (
+        ENHANCE_BASE_TOKENS
+        + scene_chars // 2
+        + ENHANCE_TOKENS_PER_SCENE * len(script.scenes)
+    )
+    return min(ENHANCE_MAX_TOKENS, estimate)
+
+
+@lru_cache(maxsize=8)
+def _enhancement_instructions(
+    enhance_narration: bool,
+    enhance_prompts: bool,
+    add_visual_style: bool,
+) -> str:
+    """Render the static instruction block once per combination of options."""
+    tasks = []
+    if enhance_narration:
+        tasks.append("Improve narration for better flow and emotional impact")
+    if enhance_prompts:
+        tasks.append("Enhance image prompts for more vivid, cinematic visuals")
+    if add_visual_style:
+        tasks.append("Add a visual_style object for consistency across scenes")
+
+    task_lines = "\n".join(f"- {t}" for t in tasks)
+    return f"Enhance the script below.\n\nTasks:\n{task_lines}"
+
+
+def _visual_style_from_dict(data: dict[str, Any]) -> VisualStyle:
+    """
+    Build a VisualStyle from a VISUAL_STYLE_SCHEMA response.
+
+    Schema-style [{name, description}] recurring elements are converted to
+    a name map; a plain dict is accepted as-is.
+    """
+    elements = data.get("recurring_elements", {})
+    if not isinstance(elements, dict):
+        elements = {e["name"]: e["description"] for e in elements}
+
+    return VisualStyle(
+        environment=data.get("environment", ""),
+        color_mood=data.get("color_mood", ""),
+        texture=data.get("texture", ""),
+        recurring_elements=elements,
+    )
+
+
+def _merge_scene(scene: Scene, enhanced_data: dict[str, Any]) -> Scene:
+    """Apply enhanced narration and image prompt to a scene, keeping the rest."""
+    return Scene(
+        scene_number=scene.scene_number,
+        narration=enhanced_data.get("narration", scene.narration),
+        image_prompt=enhanced_data.get("image_prompt", scene.image_prompt),
+        duration_estimate=scene.duration_estimate,
+    )
+
+
+class FailedPromptCache:
+    """
+    Bounded TTL cache of prompts whose responses could not be parsed.
+
+    Lets a retry in the same process skip an enhancement request that just
+    returned unusable JSON instead of paying for it again.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, max_size: int = 1024) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._failed: OrderedDict[str, float] = OrderedDict()
+
+    @staticmethod
+    def key_for(prompt: str) -> str:
+        """Hash a prompt into a cache key."""
+        return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+
+    def recently_failed(self, key: str) -> bool:
+        """Check whether a prompt failed within the TTL."""
+        failed_at = self._failed.get(key)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at < self.ttl_seconds:
+            return True
+        del self._failed[key]
+        return False
+
+    def add(self, key: str) -> None:
+        """Record a failed prompt, evicting the oldest entry when full."""
+        self._failed[key] = time.monotonic()
+        self._failed.move_to_end(key)
+        if len(self._failed) > self.max_size:
+            self._failed.popitem(last=False)
+
+
+class EnhancementCache:
+    """
+    Bounded TTL cache of enhancement results keyed by normalized prompt.
+
+    Re-runs of the same script (or copies differing only in whitespace)
+    reuse the earlier enhancement instead of issuing another LLM call.
+    The niche is part of the prompt, so entries never cross niches.
+
+    With a cache_dir, results are also persisted as ``{key}.json`` so later
+    processes reuse them. Disk entries are content-addressed and do not
+    expire; the directory should be scoped by _PROMPT_FINGERPRINT.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600.0,
+        max_size: int = 256,
+        cache_dir: Path | None = None,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    @staticmethod
+    def key_for(prompt: str) -> str:
+        """Hash a prompt into a cache key, ignoring whitespace differences."""
+        normalized = " ".join(prompt.split())
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a cached enhancement result, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return self._load(key)
+        stored_at, result = entry
+        if time.monotonic() - stored_at >= self.ttl_seconds:
+            del self._entries[key]
+            # The persisted copy does not expire; reload it if there is one
+            return self._load(key)
+        self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        """Store an enhancement result, evicting the least recently used entry."""
+        self._remember(key, result)
+        if self.cache_dir is None:
+            return
+
+        path = self.cache_dir / f"{key}.json"
+        # Unique per writer, so concurrent puts of one key never share a file
+        tmp_path = path.with_name(f"{key}.{uuid.uuid4().hex}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(to_json(result))
+            # Atomic rename so concurrent readers never see a partial file
+            tmp_path.replace(path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, result: dict[str, Any]) -> None:
+        """Store a result in memory, evicting the least recently used entry."""
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str) -> dict[str, Any] | None:
+        """Read a persisted result into memory, or None if absent or unreadable."""
+        if self.cache_dir is None:
+            return None
+        try:
+            result = from_json((self.cache_dir / f"{key}.json").read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(result, dict):
+            return None
+        self._remember(key, result)
+        return result
+
+
+class CompletionSizeHint:
+    """
+    Per-niche moving average of enhancement output tokens per scene.
+
+    Tracks the completion tokens reported for each response. Where the model
+    writes more than the static estimate allows, later scripts in the same
+    niche get a larger max_tokens. The hint is only ever used as a floor.
+    """
+
+    def __init__(self, alpha: float = 0.3, headroom: float = 1.25) -> None:
+        self.alpha = alpha
+        self.headroom = headroom
+        self._tokens_per_scene: dict[Niche, float] = {}
+
+    def observe(self, niche: Niche, scene_count: int, output_tokens: int) -> None:
+        """Fold one response's size into the niche's moving average."""
+        if scene_count <= 0:
+            return
+        sample = output_tokens / scene_count
+        previous = self._tokens_per_scene.get(niche)
+        if previous is None:
+            self._tokens_per_scene[niche] = sample
+        else:
+            self._tokens_per_scene[niche] = (
+                self.alpha * sample + (1 - self.alpha) * previous
+            )
+
+    def budget(self, niche: Niche, scene_count: int) -> int | None:
+        """Return a learned token budget, or None before any observation."""
+        per_scene = self._tokens_per_scene.get(niche)
+        if per_scene is None:
+            return None
+        return int(per_scene * scene_count * self.headroom)
 
 
 class EnhancerService(LoggerMixin):
@@ -48,6 +372,12 @@ class EnhancerService(LoggerMixin):
         """
         self._client = client or AzureOpenAIClient()
         self._settings = get_settings()
+        self._failed_prompts = FailedPromptCache()
+        self._size_hint = CompletionSizeHint()
+        cache_dir = self._settings.enhance_cache_dir
+        self._enhancement_cache = EnhancementCache(
+            cache_dir=cache_dir / _PROMPT_FINGERPRINT if cache_dir else None
+        )
 
     def enhance_script(
         self,
@@ -68,13 +398,110 @@ class EnhancerService(LoggerMixin):
         Returns:
             Enhanced script
         """
+        user_prompt, done = self._begin_enhancement(
+            script, enhance_narration, enhance_prompts, add_visual_style
+        )
+        if done is not None:
+            return done
+
+        # Get enhanced content from GPT
+        usage: dict[str, Any] = {}
+        try:
+            result = self._client.chat_json(
+                **self._enhancement_request(script, user_prompt), usage=usage
+            )
+            return self._finish_enhancement(
+                script, user_prompt, result, usage, add_visual_style
+            )
+        except Exception as e:
+            return self._enhancement_failed(script, user_prompt, e)
+
+    async def aenhance_script(
+        self,
+        script: Script,
+        enhance_narration: bool = True,
+        enhance_prompts: bool = True,
+        add_visual_style: bool = True,
+    ) -> Script:
+        """
+        Enhance a script using GPT without blocking the event loop.
+
+        Async counterpart of enhance_script, used for batch enhancement.
+
+        Args:
+            script: Original script to enhance
+            enhance_narration: Improve narration text
+            enhance_prompts: Improve image prompts
+            add_visual_style: Add/enhance visual style
+
+        Returns:
+            Enhanced script, or the original script on failure
+        """
+        user_prompt, done = self._begin_enhancement(
+            script, enhance_narration, enhance_prompts, add_visual_style
+        )
+        if done is not None:
+            return done
+
+        usage: dict[str, Any] = {}
+        try:
+            result = await self._client.achat_json(
+                **self._enhancement_request(script, user_prompt), usage=usage
+            )
+            return self._finish_enhancement(
+                script, user_prompt, result, usage, add_visual_style
+            )
+        except Exception as e:
+            return self._enhancement_failed(script, user_prompt, e)
+
+    def enhance_scripts(self, scripts: list[Script]) -> list[Script]:
+        """
+        Enhance several scripts concurrently.
+
+        Requests share one async HTTP client and are capped at
+        max_concurrent_enhancements in flight.
+
+        Args:
+            scripts: Scripts to enhance
+
+        Returns:
+            Enhanced scripts in input order (originals for any that failed)
+        """
+        return asyncio.run(self._aenhance_scripts(scripts))
+
+    async def _aenhance_scripts(self, scripts: list[Script]) -> list[Script]:
+        """Enhance scripts under a concurrency semaphore."""
+        semaphore = asyncio.Semaphore(self._settings.max_concurrent_enhancements)
+
+        async def enhance_one(script: Script) -> Script:
+            async with semaphore:
+                return await self.aenhance_script(script)
+
+        try:
+            return list(await asyncio.gather(*map(enhance_one, scripts)))
+        finally:
+            await self._client.aclose()
+
+    def _begin_enhancement(
+        self,
+        script: Script,
+        enhance_narration: bool,
+        enhance_prompts: bool,
+        add_visual_style: bool,
+    ) -> tuple[str, Script | None]:
+        """
+        Build the enhancement prompt and check it against the caches.
+
+        Returns:
+            The user prompt, and the script to return without a request
+            (cached result or recently failed prompt), or None to send one
+        """
         self.logger.info(
             "Enhancing script",
             title=script.title,
             scene_count=len(script.scenes),
         )
 
-        # Build enhancement prompt
         user_prompt = self._build_enhancement_prompt(
             script=script,
             enhance_narration=enhance_narration,
@@ -82,31 +509,102 @@ class EnhancerService(LoggerMixin):
             add_visual_style=add_visual_style,
         )
 
-        # Get enhanced content from GPT
-        try:
-            result = self._client.chat_json(
-                system_prompt=ENHANCE_SYSTEM_PROMPT,
-                user_prompt=user_prompt,
-                temperature=0.7,
-                max_tokens=4000,
+        if self._failed_prompts.recently_failed(FailedPromptCache.key_for(user_prompt)):
+            self.logger.warning(
+                "Identical prompt recently returned invalid JSON, returning original",
+                title=script.title,
             )
+            return user_prompt, script
+
+        cached = self._enhancement_cache.get(EnhancementCache.key_for(user_prompt))
+        if cached is not None:
+            self.logger.info("Reusing cached enhancement", title=script.title)
+            return user_prompt, self._apply_enhancements(script, cached)
+
+        return user_prompt, None
+
+    def _enhancement_request(self, script: Script, user_prompt: str) -> dict[str, Any]:
+        """Keyword arguments for the chat_json/achat_json enhancement call."""
+        return {
+            "system_prompt": ENHANCE_SYSTEM_PROMPT,
+            "user_prompt": user_prompt,
+            "temperature": 0.7,
+            "max_tokens": self._max_tokens_for(script),
+            "json_schema": ENHANCED_SCRIPT_SCHEMA,
+        }
 
-            # Update script with enhanced content
-            enhanced_script = self._apply_enhancements(script, result)
+    def _finish_enhancement(
+        self,
+        script: Script,
+        user_prompt: str,
+        result: dict[str, Any],
+        usage: dict[str, Any],
+        add_visual_style: bool,
+    ) -> Script:
+        """
+        Validate a response, apply it to the script and cache it.
 
-            self.logger.info(
-                "Script enhanced successfully",
-                title=enhanced_script.title,
-            )
+        Raises:
+            ValueError: If the response does not match ENHANCED_SCRIPT_SCHEMA
+        """
+        # ValidationError is a ValueError, so a malformed response is
+        # remembered as a failed prompt by _enhancement_failed
+        _EnhancementResponse.model_validate(result)
+        self._observe_size(script, usage)
+        if not add_visual_style:
+            # The schema always yields a style; keep the script's own
+            result.pop("visual_style", None)
+
+        # Update script with enhanced content
+        enhanced_script = self._apply_enhancements(script, result)
+        self._enhancement_cache.put(EnhancementCache.key_for(user_prompt), result)
 
-            return enhanced_script
+        self.logger.info(
+            "Script enhanced successfully",
+            title=enhanced_script.title,
+        )
 
-        except Exception as e:
+        return enhanced_script
+
+    def _enhancement_failed(
+        self,
+        script: Script,
+        user_prompt: str,
+        error: Exception,
+    ) -> Script:
+        """Log a failed enhancement and return the original script."""
+        if isinstance(error, ValueError):
+            # Malformed or invalid JSON: don't pay for the same request again
+            self._failed_prompts.add(FailedPromptCache.key_for(user_prompt))
+            self.logger.error(
+                "Enhancement response unusable, returning original",
+                error=str(error),
+            )
+        else:
             self.logger.error(
                 "Script enhancement failed, returning original",
-                error=str(e),
+                error=str(error),
             )
-            return script
+        return script
+
+    def _max_tokens_for(self, script: Script) -> int:
+        """
+        Pick max_tokens from the script-size estimate and the learned hint.
+
+        The hint can only raise the budget. Going below the estimate would
+        truncate a script whose scenes are longer than the niche's earlier ones.
+        """
+        estimate = _enhancement_max_tokens(script)
+        learned = self._size_hint.budget(script.niche, len(script.scenes))
+        if learned is None:
+            return estimate
+        return min(ENHANCE_MAX_TOKENS, max(estimate, learned))
+
+    def _observe_size(self, script: Script, usage: dict[str, Any]) -> None:
+        """Record the completion tokens a response actually used."""
+        completion_tokens = usage.get("completion_tokens")
+        if completion_tokens:
+            self._size_hint.observe(script.niche, len(script.scenes), completion_tokens)
 
     def _build_enhancement_prompt(
         self,
@@ -115,50 +613,36 @@ class EnhancerService(LoggerMixin):
         enhance_prompts: bool,
         add_visual_style: bool,
     ) -> str:
-        """Build the enhancement prompt."""
-        tasks = []
-        if enhance_narration:
-            tasks.append("Improve narration for better flow and emotional impact")
-        if enhance_prompts:
-            tasks.append("Enhance image prompts for more vivid, cinematic visuals")
-        if add_visual_style:
-            tasks.append("Add a visual_style object for consistency across scenes")
-
-        scenes_json = [
-            {
-                "scene_number": s.scene_number,
-                "narration": s.narration,
-                "image_prompt": s.image_prompt,
-            }
-            for s in script.scenes
-        ]
-
-        return f"""Enhance this {script.niche.value} script.
-
-Tasks:
-{chr(10).join(f"- {t}" for t in tasks)}
+        """
+        Build the enhancement prompt.
 
-Title: {script.title}
+        Static instructions come first and script data last, so the prompt
+        prefix is byte-identical across scripts and niches and can be served
+        from the provider's prompt cache.
+        """
+        # Serialized as compact JSON; script text is never run through a
+        # format parser, so braces and quotes in narration are safe
+        scenes_json = to_json(
+            [
+                {
+                    "scene_number": s.scene_number,
+                    "narration": s.narration,
+                    "image_prompt": s.image_prompt,
+                }
+                for s in script.scenes
+            ]
+        ).decode()
+
+        instructions = _enhancement_instructions(
+            enhance_narration, enhance_prompts, add_visual_style
+        )
+
+        return f"""{instructions}
+
+Script:
 Niche: {script.niche.value}
-Scenes: {scenes_json}
-
-Return a JSON object with:
-{{
-    "title": "enhanced or original title",
-    "visual_style": {{
-        "environment": "consistent environment description",
-        "color_mood": "color palette and mood",
-        "texture": "surface and material details",
-        "recurring_elements": {{"element_name": "description"}}
-    }},
-    "scenes": [
-        {{
-            "scene_number": 1,
-            "narration": "enhanced narration",
-            "image_prompt": "enhanced image prompt"
-        }}
-    ]
-}}"""
+Title: {script.title}
+Scenes: {scenes_json}"""
 
     def _apply_enhancements(
         self,
@@ -174,24 +658,12 @@ Return a JSON object with:
 
         for scene in original.scenes:
             enhanced_data = enhancement_scenes.get(scene.scene_number, {})
-            enhanced_scene = Scene(
-                scene_number=scene.scene_number,
-                narration=enhanced_data.get("narration", scene.narration),
-                image_prompt=enhanced_data.get("image_prompt", scene.image_prompt),
-                duration_estimate=scene.duration_estimate,
-            )
-            enhanced_scenes.append(enhanced_scene)
+            enhanced_scenes.append(_merge_scene(scene, enhanced_data))
 
         # Create visual style if provided
         visual_style = None
         if "visual_style" in enhancements:
-            vs = enhancements["visual_style"]
-            visual_style = VisualStyle(
-                environment=vs.get("environment", ""),
-                color_mood=vs.get("color_mood", ""),
-                texture=vs.get("texture", ""),
-                recurring_elements=vs.get("recurring_elements", {}),
-            )
+            visual_style = _visual_style_from_dict(enhancements["visual_style"])
 
         # Create enhanced script
         from datetime import datetime
@@ -224,29 +696,17 @@ Return a JSON object with:
         prompt = f"""Create a visual style for this {script.niche.value} video:
 
 Title: {script.title}
-First scene: {script.scenes[0].narration[:200] if script.scenes else "N/A"}
-
-Return JSON with:
-{{
-    "environment": "consistent setting description",
-    "color_mood": "color palette and emotional tone",
-    "texture": "surface and material details",
-    "recurring_elements": {{"name": "visual description"}}
-}}"""
+First scene: {script.scenes[0].narration[:200] if script.scenes else "N/A"}"""
 
         try:
             result = self._client.chat_json(
                 system_prompt="You are a visual designer for video content. Create cohesive visual styles.",
                 user_prompt=prompt,
                 temperature=0.7,
+                json_schema=GENERATED_VISUAL_STYLE_SCHEMA,
             )
 
-            return VisualStyle(
-                environment=result.get("environment", ""),
-                color_mood=result.get("color_mood", ""),
-                texture=result.get("texture", ""),
-                recurring_elements=result.get("recurring_elements", {}),
-            )
+            return _visual_style_from_dict(result)
 
         except Exception as e:
             self.logger.warning(
@@ -6,6 +6,9 @@ and engagement factors to ensure only high-quality content proceeds to
 expensive generation stages.
 """
 
+import copy
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -17,6 +20,16 @@ from faceless.core.enums import Niche
 from faceless.core.models import Script
 from faceless.utils.logging import LoggerMixin
 
+# Mid-video retention analyses remembered per service instance
+MID_HOOK_CACHE_SIZE = 256
+
+# Output token caps for the small single-purpose checks. Their JSON replies are
+# a few hundred tokens, so the client's 4000 default only reserves capacity
+# the model never uses.
+HOOK_EVALUATION_MAX_TOKENS = 600
+MID_VIDEO_CHECK_MAX_TOKENS = 600
+HOOK_ALTERNATIVE_MAX_TOKENS = 80
+
 
 class QualityGate(str, Enum):
     """Quality gates that scripts must pass."""
@@ -214,6 +227,7 @@ class QualityService(LoggerMixin):
         self._client = client or AzureOpenAIClient()
         self._settings = get_settings()
         self._thresholds = thresholds or DEFAULT_THRESHOLDS
+        self._mid_hook_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
 
     def evaluate_script(
         self,
@@ -294,6 +308,7 @@ Return JSON with:
                 system_prompt=QUALITY_SYSTEM_PROMPT,
                 user_prompt=prompt,
                 temperature=0.5,
+                max_tokens=HOOK_EVALUATION_MAX_TOKENS,
             )
 
             return HookAnalysis(
@@ -349,6 +364,7 @@ Return JSON array of {count} hook strings."""
                 system_prompt=QUALITY_SYSTEM_PROMPT,
                 user_prompt=prompt,
                 temperature=0.9,  # Higher creativity
+                max_tokens=100 + HOOK_ALTERNATIVE_MAX_TOKENS * count,
             )
 
             if isinstance(result, list):
@@ -385,6 +401,16 @@ Return JSON array of {count} hook strings."""
         mid_end = (len(script.scenes) * 2) // 3
         mid_content = " ".join(s.narration for s in script.scenes[mid_start:mid_end])
 
+        # Same niche and middle section means the same analysis; skip the call
+        cache_key = hashlib.blake2b(
+            f"{script.niche.value}\n{mid_content[:1000]}".encode(), digest_size=16
+        ).hexdigest()
+        cached = self._mid_hook_cache.get(cache_key)
+        if cached is not None:
+            self._mid_hook_cache.move_to_end(cache_key)
+            # Deep copy: callers may mutate the nested hook and suggestion lists
+            return copy.deepcopy(cached)
+
         prompt = f"""Analyze the middle section of this {script.niche.display_name} script for retention hooks.
 
 Middle content:
@@ -406,16 +432,22 @@ Return JSON with:
 }}"""
 
         try:
-            return self._client.chat_json(
+            result = self._client.chat_json(
                 system_prompt=QUALITY_SYSTEM_PROMPT,
                 user_prompt=prompt,
                 temperature=0.5,
+                max_tokens=MID_VIDEO_CHECK_MAX_TOKENS,
             )
 
         except Exception as e:
             self.logger.warning("Mid-video analysis failed", error=str(e))
             return {"has_mid_hooks": False, "error": str(e)}
 
+        self._mid_hook_cache[cache_key] = result
+        if len(self._mid_hook_cache) > MID_HOOK_CACHE_SIZE:
+            self._mid_hook_cache.popitem(last=False)
+        return copy.deepcopy(result)
+
     def _prepare_script_content(self, script: Script) -> str:
         """Prepare script content for analysis."""
         scenes_text = []
@@ -6,11 +6,15 @@ web search integration, and multi-source fact verification to create
 high-quality, authoritative content.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
+from pydantic_core import to_json
+
 from faceless.clients.azure_openai import AzureOpenAIClient
 from faceless.config import get_settings
 from faceless.core.enums import Niche
@@ -117,9 +121,10 @@ class ResearchOutput:
         }
 
 
-# Research prompts by depth level
-RESEARCH_PROMPTS = {
-    ResearchDepth.QUICK: """You are a research assistant. Provide quick, factual research on the topic.
+# Research prompts by depth level (read-only; shared by every service instance)
+RESEARCH_PROMPTS: Mapping[ResearchDepth, str] = MappingProxyType(
+    {
+        ResearchDepth.QUICK: """You are a research assistant. Provide quick, factual research on the topic.
 
 Focus on:
 - 3-5 key facts
@@ -127,7 +132,7 @@ Focus on:
 - Basic context
 
 Keep it concise and accurate.""",
-    ResearchDepth.STANDARD: """You are an expert research assistant. Provide comprehensive research on the topic.
+        ResearchDepth.STANDARD: """You are an expert research assistant. Provide comprehensive research on the topic.
 
 Focus on:
 - 5-10 key findings with importance ranking
@@ -138,7 +143,7 @@ Focus on:
 - Expert quotes or perspectives
 
 Be thorough but organized.""",
-    ResearchDepth.DEEP: """You are a senior research analyst. Provide expert-level research on the topic.
+        ResearchDepth.DEEP: """You are a senior research analyst. Provide expert-level research on the topic.
 
 Focus on:
 - 10-15 key findings with detailed analysis
@@ -152,7 +157,7 @@ Focus on:
 - Visual storytelling opportunities
 
 Be comprehensive and analytical. Cite sources where possible.""",
-    ResearchDepth.INVESTIGATIVE: """You are an investigative researcher. Provide exhaustive research on the topic.
+        ResearchDepth.INVESTIGATIVE: """You are an investigative researcher. Provide exhaustive research on the topic.
 
 Focus on:
 - All relevant facts and findings
@@ -166,6 +171,100 @@ Focus on:
 - Series structure recommendations
 
 Leave no stone unturned. This research should support documentary-level content.""",
+    }
+)
+
+
+# Per-niche research guidance appended after the shared prompt prefix
+NICHE_RESEARCH_FOCUS: Mapping[Niche, str] = MappingProxyType(
+    {
+        Niche.SCARY_STORIES: "Focus on atmospheric details, psychological elements, and building dread.",
+        Niche.FINANCE: "Include specific numbers, percentages, and actionable insights.",
+        Niche.LUXURY: "Emphasize exclusivity, craftsmanship, and aspirational elements.",
+        Niche.TRUE_CRIME: "Focus on factual accuracy, timeline, and investigative details.",
+        Niche.PSYCHOLOGY_FACTS: "Include scientific studies and practical applications.",
+        Niche.HISTORY: "Emphasize chronology, cause-effect, and lesser-known details.",
+        Niche.MOTIVATION: "Focus on actionable strategies and success stories.",
+        Niche.SPACE_ASTRONOMY: "Include scale comparisons and mind-blowing facts.",
+        Niche.CONSPIRACY_MYSTERIES: "Present multiple perspectives and evidence objectively.",
+        Niche.ANIMAL_FACTS: "Include surprising behaviors and evolutionary context.",
+        Niche.HEALTH_WELLNESS: "Cite scientific sources and include practical tips.",
+        Niche.RELATIONSHIP_ADVICE: "Focus on psychology-backed advice and real scenarios.",
+        Niche.TECH_GADGETS: "Include specs, comparisons, and future implications.",
+        Niche.LIFE_HACKS: "Focus on practical, immediately actionable tips.",
+        Niche.MYTHOLOGY_FOLKLORE: "Include cultural context and storytelling elements.",
+        Niche.UNSOLVED_MYSTERIES: "Present all theories objectively with evidence.",
+        Niche.GEOGRAPHY_FACTS: "Include comparative data and visual opportunities.",
+        Niche.AI_FUTURE_TECH: "Balance hype with realistic timeline expectations.",
+        Niche.PHILOSOPHY: "Make complex ideas accessible with examples.",
+        Niche.BOOK_SUMMARIES: "Capture key insights and actionable takeaways.",
+        Niche.CELEBRITY_NET_WORTH: "Include income sources and financial decisions.",
+        Niche.SURVIVAL_TIPS: "Focus on practical, life-saving information.",
+        Niche.SLEEP_RELAXATION: "Include science-backed techniques and calming elements.",
+    }
+)
+
+
+def _object_schema(properties: dict[str, Any]) -> dict[str, Any]:
+    """Build a strict object schema requiring every property."""
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+def _list_of(items: dict[str, Any]) -> dict[str, Any]:
+    """Build an array schema."""
+    return {"type": "array", "items": items}
+
+
+_STRING: dict[str, Any] = {"type": "string"}
+_NUMBER: dict[str, Any] = {"type": "number"}
+
+# Structured output schema for research_topic; replaces an inline JSON example
+RESEARCH_RESULT_SCHEMA: dict[str, Any] = {
+    "name": "research_result",
+    "schema": _object_schema(
+        {
+            "key_findings": _list_of(
+                _object_schema(
+                    {
+                        "content": _STRING,
+                        "category": {
+                            "type": "string",
+                            "enum": ["fact", "statistic", "insight"],
+                        },
+                        "importance": _NUMBER,
+                    }
+                )
+            ),
+            "statistics": _list_of(
+                _object_schema(
+                    {"content": _STRING, "source": _STRING, "importance": _NUMBER}
+                )
+            ),
+            "expert_quotes": _list_of(
+                _object_schema({"content": _STRING, "source": _STRING})
+            ),
+            "counterarguments": _list_of(
+                _object_schema({"content": _STRING, "response": _STRING})
+            ),
+            "historical_context": _STRING,
+            "recent_developments": {
+                "type": "string",
+                "description": "What's new in the last 1-2 years",
+            },
+            "why_it_matters": _STRING,
+            "suggested_hook": _STRING,
+            "suggested_structure": _list_of(_STRING),
+            "visual_opportunities": _list_of(_STRING),
+            "follow_up_topics": _list_of(_STRING),
+            "multi_video_potential": {"type": "boolean"},
+            "confidence_score": _NUMBER,
+        }
+    ),
 }
 
 
@@ -248,6 +347,7 @@ class DeepResearchService(LoggerMixin):
                 user_prompt=user_prompt,
                 temperature=0.7,
                 max_tokens=max_tokens,
+                json_schema=RESEARCH_RESULT_SCHEMA,
             )
 
             research_output = self._parse_research_result(result, topic, niche, depth)
@@ -375,8 +475,8 @@ Return as JSON array."""
         """
         prompt = f"""Based on this research about "{research.topic}", create an optimal video structure.
 
-Key findings: {[f.content for f in research.key_findings[:5]]}
-Statistics: {[f.content for f in research.statistics[:3]]}
+Key findings: {to_json([f.content for f in research.key_findings[:5]]).decode()}
+Statistics: {to_json([f.content for f in research.statistics[:3]]).decode()}
 Hook suggestion: {research.suggested_hook}
 
 Target duration: {target_duration} seconds ({target_duration // 60} minutes)
@@ -417,66 +517,16 @@ Return JSON with:
         additional_context: str,
     ) -> str:
         """Build the research request prompt."""
-        niche_context = {
-            Niche.SCARY_STORIES: "Focus on atmospheric details, psychological elements, and building dread.",
-            Niche.FINANCE: "Include specific numbers, percentages, and actionable insights.",
-            Niche.LUXURY: "Emphasize exclusivity, craftsmanship, and aspirational elements.",
-            Niche.TRUE_CRIME: "Focus on factual accuracy, timeline, and investigative details.",
-            Niche.PSYCHOLOGY_FACTS: "Include scientific studies and practical applications.",
-            Niche.HISTORY: "Emphasize chronology, cause-effect, and lesser-known details.",
-            Niche.MOTIVATION: "Focus on actionable strategies and success stories.",
-            Niche.SPACE_ASTRONOMY: "Include scale comparisons and mind-blowing facts.",
-            Niche.CONSPIRACY_MYSTERIES: "Present multiple perspectives and evidence objectively.",
-            Niche.ANIMAL_FACTS: "Include surprising behaviors and evolutionary context.",
-            Niche.HEALTH_WELLNESS: "Cite scientific sources and include practical tips.",
-            Niche.RELATIONSHIP_ADVICE: "Focus on psychology-backed advice and real scenarios.",
-            Niche.TECH_GADGETS: "Include specs, comparisons, and future implications.",
-            Niche.LIFE_HACKS: "Focus on practical, immediately actionable tips.",
-            Niche.MYTHOLOGY_FOLKLORE: "Include cultural context and storytelling elements.",
-            Niche.UNSOLVED_MYSTERIES: "Present all theories objectively with evidence.",
-            Niche.GEOGRAPHY_FACTS: "Include comparative data and visual opportunities.",
-            Niche.AI_FUTURE_TECH: "Balance hype with realistic timeline expectations.",
-            Niche.PHILOSOPHY: "Make complex ideas accessible with examples.",
-            Niche.BOOK_SUMMARIES: "Capture key insights and actionable takeaways.",
-            Niche.CELEBRITY_NET_WORTH: "Include income sources and financial decisions.",
-            Niche.SURVIVAL_TIPS: "Focus on practical, life-saving information.",
-            Niche.SLEEP_RELAXATION: "Include science-backed techniques and calming elements.",
-        }
-
-        context = niche_context.get(niche, "")
+        # Static instruction first, per-request details last, so requests for
+        # any niche share the longest possible cacheable prompt prefix
+        return f"""Provide your research as JSON matching the research_result schema.
 
-        return f"""Research Topic: {topic}
 Niche: {niche.display_name}
+Niche-Specific Focus: {NICHE_RESEARCH_FOCUS.get(niche, "")}
 Research Depth: {depth.value}
 
-Niche-Specific Focus: {context}
-
-{f"Additional Context: {additional_context}" if additional_context else ""}
-
-Provide your research as JSON with this structure:
-{{
-    "key_findings": [
-        {{"content": "finding text", "category": "fact|statistic|insight", "importance": 0.9}}
-    ],
-    "statistics": [
-        {{"content": "statistic with number", "source": "source name", "importance": 0.8}}
-    ],
-    "expert_quotes": [
-        {{"content": "quote or paraphrase", "source": "expert/organization name"}}
-    ],
-    "counterarguments": [
-        {{"content": "opposing view or nuance", "response": "how to address it"}}
-    ],
-    "historical_context": "Background and timeline",
-    "recent_developments": "What's new in the last 1-2 years",
-    "why_it_matters": "Why audience should care",
-    "suggested_hook": "Attention-grabbing opening line",
-    "suggested_structure": ["Section 1", "Section 2", "Section 3"],
-    "visual_opportunities": ["Visual idea 1", "Visual idea 2"],
-    "follow_up_topics": ["Related topic 1", "Related topic 2"],
-    "multi_video_potential": true/false,
-    "confidence_score": 0.85
-}}"""
+Research Topic: {topic}
+{f"Additional Context: {additional_context}" if additional_context else ""}"""
 
     def _parse_research_result(
         self,
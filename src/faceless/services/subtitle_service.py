@@ -5,16 +5,21 @@ Creates SRT/VTT subtitle files from audio using Azure Speech-to-Text
 Supports word-level timestamps for animated captions (TikTok style)
 """
 
-import json
 import subprocess
 from pathlib import Path
 from typing import Any
 
+from pydantic_core import from_json, to_json
+
 from faceless.config import get_settings
 from faceless.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Defaults shared by the single-format writers and generate_all_subtitle_formats
+DEFAULT_WORDS_PER_SUBTITLE = 8
+DEFAULT_CAPTION_STYLE = "word_by_word"
+
 # Subtitle style presets per niche
 SUBTITLE_STYLES: dict[str, dict[str, Any]] = {
     "scary-stories": {
@@ -55,19 +60,18 @@ SUBTITLE_STYLES: dict[str, dict[str, Any]] = {
 
 def format_timestamp_srt(seconds: float) -> str:
     """Convert seconds to SRT timestamp format (HH:MM:SS,mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
+    # Rounded to the nearest millisecond: truncating turns 2.3 into 2.299
+    secs, millis = divmod(round(seconds * 1000), 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
 def format_timestamp_vtt(seconds: float) -> str:
     """Convert seconds to VTT timestamp format (HH:MM:SS.mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
+    secs, millis = divmod(round(seconds * 1000), 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
 
 
@@ -90,11 +94,27 @@ def get_audio_duration(audio_path: str | Path) -> float:
         return 60.0  # Default fallback
 
 
+def _load_script(script_path: Path) -> dict[str, Any]:
+    """Read and parse a script JSON file."""
+    script: dict[str, Any] = from_json(Path(script_path).read_bytes())
+    return script
+
+
+def _prepare_output_dir(niche: str, output_dir: Path | None) -> Path:
+    """Resolve and create the output directory (niche audio dir by default)."""
+    if output_dir is None:
+        settings = get_settings()
+        output_dir = settings.output_base_dir / niche / "audio"
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+
 def create_subtitles_from_script(
     script_path: str | Path,
     niche: str,
     output_dir: Path | None = None,
-    words_per_subtitle: int = 8,
+    words_per_subtitle: int = DEFAULT_WORDS_PER_SUBTITLE,
 ) -> tuple[Path, Path]:
     """
     Create subtitle files from script narration and audio durations.
@@ -112,15 +132,21 @@ def create_subtitles_from_script(
         Tuple of (SRT path, VTT path)
     """
     script_path = Path(script_path)
-    with open(script_path, encoding="utf-8") as f:
-        script = json.load(f)
+    return _write_subtitles(
+        _load_script(script_path),
+        script_path.stem,
+        _prepare_output_dir(niche, output_dir),
+        words_per_subtitle,
+    )
 
-    base_name = script_path.stem
-    if output_dir is None:
-        settings = get_settings()
-        output_dir = settings.output_base_dir / niche / "audio"
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+
+def _write_subtitles(
+    script: dict[str, Any],
+    base_name: str,
+    output_dir: Path,
+    words_per_subtitle: int,
+) -> tuple[Path, Path]:
+    """Write SRT and VTT files for an already-loaded script."""
 
     srt_path = output_dir / f"{base_name}.srt"
     vtt_path = output_dir / f"{base_name}.vtt"
@@ -156,19 +182,16 @@ def create_subtitles_from_script(
             end_time = min(end_time, current_time + duration)
 
             # SRT format
-            srt_entries.append(str(subtitle_index))
-            start_srt = format_timestamp_srt(start_time)
-            end_srt = format_timestamp_srt(end_time)
-            srt_entries.append(f"{start_srt} --> {end_srt}")
-            srt_entries.append(chunk_text)
-            srt_entries.append("")
-
-            # VTT format
-            start_vtt = format_timestamp_vtt(start_time)
-            end_vtt = format_timestamp_vtt(end_time)
-            vtt_entries.append(f"{start_vtt} --> {end_vtt}")
-            vtt_entries.append(chunk_text)
-            vtt_entries.append("")
+            timing_srt = (
+                f"{format_timestamp_srt(start_time)} --> "
+                f"{format_timestamp_srt(end_time)}"
+            )
+            srt_entries.extend((str(subtitle_index), timing_srt, chunk_text, ""))
+
+            # VTT format differs only in the millisecond separator, so reuse
+            # the SRT timings instead of formatting them again
+            timing_vtt = timing_srt.replace(",", ".")
+            vtt_entries.extend((timing_vtt, chunk_text, ""))
 
             subtitle_index += 1
 
@@ -312,7 +335,7 @@ def generate_animated_captions(
     script_path: str | Path,
     niche: str,
     output_dir: Path | None = None,
-    style: str = "word_by_word",
+    style: str = DEFAULT_CAPTION_STYLE,
 ) -> Path:
     """
     Generate animated caption data for TikTok-style word-by-word display.
@@ -330,15 +353,23 @@ def generate_animated_captions(
         Path to caption animation JSON
     """
     script_path = Path(script_path)
-    with open(script_path, encoding="utf-8") as f:
-        script = json.load(f)
+    return _write_animated_captions(
+        _load_script(script_path),
+        script_path.stem,
+        niche,
+        _prepare_output_dir(niche, output_dir),
+        style,
+    )
 
-    base_name = script_path.stem
-    if output_dir is None:
-        settings = get_settings()
-        output_dir = settings.output_base_dir / niche / "audio"
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+
+def _write_animated_captions(
+    script: dict[str, Any],
+    base_name: str,
+    niche: str,
+    output_dir: Path,
+    style: str,
+) -> Path:
+    """Write caption animation JSON for an already-loaded script."""
     output_path = output_dir / f"{base_name}_captions.json"
 
     captions: list[dict[str, Any]] = []
@@ -354,19 +385,17 @@ def generate_animated_captions(
             continue
 
         time_per_word = duration / len(words)
-
-        for i, word in enumerate(words):
-            start = current_time + (i * time_per_word)
-            end = start + time_per_word
-
-            captions.append(
-                {
-                    "word": word,
-                    "start": round(start, 3),
-                    "end": round(end, 3),
-                    "scene": scene["scene_number"],
-                }
-            )
+        scene_number = scene["scene_number"]
+
+        # Word i spans boundaries i and i + 1, so each boundary is computed
+        # and rounded once rather than twice
+        bounds = [
+            round(current_time + i * time_per_word, 3) for i in range(len(words) + 1)
+        ]
+        captions.extend(
+            {"word": word, "start": start, "end": end, "scene": scene_number}
+            for word, start, end in zip(words, bounds, bounds[1:], strict=False)
+        )
 
         current_time += duration
 
@@ -379,8 +408,8 @@ def generate_animated_captions(
         "captions": captions,
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2)
+    # Native encoder; caption lists can run to thousands of entries
+    output_path.write_bytes(to_json(output_data, indent=2))
 
     logger.info(
         "Created animated caption data",
@@ -412,11 +441,20 @@ def generate_all_subtitle_formats(
         niche=niche,
     )
 
-    srt_path, vtt_path = create_subtitles_from_script(
-        script_path, niche, output_dir=output_dir
+    # Parse the script and create the output directory once, shared by
+    # both writers
+    script_path = Path(script_path)
+    script = _load_script(script_path)
+    output_dir = _prepare_output_dir(niche, output_dir)
+
+    srt_path, vtt_path = _write_subtitles(
+        script,
+        script_path.stem,
+        output_dir,
+        words_per_subtitle=DEFAULT_WORDS_PER_SUBTITLE,
     )
-    captions_path = generate_animated_captions(
-        script_path, niche, output_dir=output_dir
+    captions_path = _write_animated_captions(
+        script, script_path.stem, niche, output_dir, style=DEFAULT_CAPTION_STYLE
     )
 
     return {
@@ -6,11 +6,14 @@ Thumbnails are 80% of click-through rate - this is critical for views
 """
 
 import base64
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+from faceless.clients.base import SharedClient
 from faceless.config import get_settings
 from faceless.utils.logging import get_logger
 
@@ -100,6 +103,57 @@ THUMBNAIL_CONCEPTS: dict[str, str] = {
 }
 
 
+# Whole-word fillers stripped from titles ("Theory" keeps its "The")
+_TITLE_FILLER_PATTERN = re.compile(r"\b(?:Why|How|The)\b")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Appended to every thumbnail prompt
+_COMPOSITION_GUIDANCE = (
+    ", extreme close-up or medium shot, "
+    "rule of thirds composition, "
+    "space for text overlay on left or right third, "
+    "16:9 aspect ratio optimized"
+)
+
+# Text color, outline color and font per niche; unknown niches get luxury
+_OVERLAY_STYLE: dict[str, tuple[str, str, str]] = {
+    "scary-stories": ("#FF0000", "#000000", "Impact or Bebas Neue"),
+    "finance": ("#00FF00", "#FFFFFF", "Montserrat Bold or Arial Black"),
+    "luxury": ("#FFD700", "#000000", "Playfair Display or Times New Roman Bold"),
+}
+
+_OVERLAY_TIPS = (
+    "Use ALL CAPS for impact",
+    "Maximum 4-5 words visible",
+    "Contrast with background",
+    "Don't cover face if person is in image",
+)
+
+# Shared image client; variant batches reuse one keep-alive pool, so only the
+# first request pays for the TCP and TLS handshake
+_get_client = SharedClient(timeout=120.0).get
+
+
+def _download_image(client: httpx.Client, url: str, output_path: Path) -> None:
+    """
+    Stream a generated image to disk without buffering it in memory.
+
+    The body is written to a .part file and renamed on completion, so an
+    interrupted download never leaves a truncated thumbnail behind to be
+    mistaken for a finished one.
+    """
+    part_path = output_path.with_suffix(".part")
+    try:
+        with client.stream("GET", url, timeout=60.0) as response:
+            response.raise_for_status()
+            with part_path.open("wb") as f:
+                for chunk in response.iter_bytes(1 << 16):
+                    f.write(chunk)
+        part_path.replace(output_path)
+    finally:
+        part_path.unlink(missing_ok=True)
+
+
 def generate_thumbnail_prompt(
     title: str,
     niche: str,
@@ -124,29 +178,20 @@ def generate_thumbnail_prompt(
     if custom_subject:
         subject = custom_subject
     else:
-        # Simple extraction - take meaningful words from title
-        subject = title.replace("Why", "").replace("How", "")
-        subject = subject.replace("The", "").strip()
+        # Simple extraction - drop filler words and tidy the gaps they leave
+        subject = _TITLE_FILLER_PATTERN.sub("", title)
+        subject = _WHITESPACE_PATTERN.sub(" ", subject).strip()
 
     # Get concept description
     concept_desc = THUMBNAIL_CONCEPTS.get(concept, THUMBNAIL_CONCEPTS["reveal"])
 
-    # Build the prompt
+    # Build the prompt, ending with composition guidance for thumbnails
     prompt_template: str = str(template["prompt_template"])
-    prompt = prompt_template.format(subject=subject)
-    prompt += f", {concept_desc}"
-    prompt += f", {template['style']}"
-
-    # Add composition guidance for thumbnails
-    prompt += (
-        ", extreme close-up or medium shot, "
-        "rule of thirds composition, "
-        "space for text overlay on left or right third, "
-        "16:9 aspect ratio optimized"
+    return (
+        f"{prompt_template.format(subject=subject)}, {concept_desc}, "
+        f"{template['style']}{_COMPOSITION_GUIDANCE}"
     )
 
-    return prompt
-
 
 def generate_thumbnail(
     prompt: str,
@@ -206,25 +251,21 @@ def generate_thumbnail(
     )
 
     try:
-        with httpx.Client(timeout=120.0) as client:
-            response = client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            result = response.json()
+        client = _get_client()
+        response = client.post(url, headers=headers, json=payload)
+        response.raise_for_status()
+        result = response.json()
 
         if "data" in result and len(result["data"]) > 0:
             image_data = result["data"][0]
 
             if "url" in image_data:
-                with httpx.Client(timeout=60.0) as client:
-                    img_response = client.get(image_data["url"])
-                    img_bytes = img_response.content
+                _download_image(client, image_data["url"], output_path)
             elif "b64_json" in image_data:
-                img_bytes = base64.b64decode(image_data["b64_json"])
+                output_path.write_bytes(base64.b64decode(image_data["b64_json"]))
             else:
                 raise ValueError("Unexpected response format")
 
-            output_path.write_bytes(img_bytes)
-
             # Save prompt for reference
             prompt_path = output_path.with_suffix(".txt")
             prompt_path.write_text(prompt, encoding="utf-8")
@@ -279,19 +320,39 @@ def generate_thumbnail_variants(
         title=title,
     )
 
-    paths: list[Path | None] = []
-    for i, concept in enumerate(concepts, 1):
+    def generate_variant(index: int, concept: str) -> Path | None:
+        """Generate one variant, returning None on failure."""
         prompt = generate_thumbnail_prompt(title, niche, concept)
-        output_name = f"{base_name}_thumb_v{i}_{concept}"
+        output_name = f"{base_name}_thumb_v{index}_{concept}"
 
         try:
-            path = generate_thumbnail(prompt, niche, output_name, output_dir)
-            paths.append(path)
+            return generate_thumbnail(prompt, niche, output_name, output_dir)
         except Exception as e:
-            logger.warning("Failed to generate variant", variant=i, error=str(e))
-            paths.append(None)
+            logger.warning("Failed to generate variant", variant=index, error=str(e))
+            return None
+
+    if not concepts:
+        return []
+
+    # Variants are independent network-bound requests; run them together
+    max_workers = min(len(concepts), get_settings().max_concurrent_images)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(generate_variant, range(1, len(concepts) + 1), concepts)
+        )
 
-    return paths
+
+def _first_n_words(title: str, n: int) -> str:
+    """
+    Shorten a title to its first n words, marking the cut with "...".
+
+    Titles of n words or fewer are returned unchanged. maxsplit stops the
+    scan after n words instead of splitting the whole title.
+    """
+    words = title.split(maxsplit=n)
+    if len(words) <= n:
+        return title
+    return " ".join(words[:n]) + "..."
 
 
 def create_text_overlay_instructions(
@@ -312,22 +373,12 @@ def create_text_overlay_instructions(
         Dict with text overlay specifications
     """
     # Extract key words for thumbnail text (shorter than full title)
-    words = title.split()
-    thumb_text = " ".join(words[:5]) + "..." if len(words) > 5 else title
+    thumb_text = _first_n_words(title, 5)
 
     # Generate color recommendations based on niche
-    if niche == "scary-stories":
-        text_color = "#FF0000"  # Red
-        outline_color = "#000000"  # Black
-        font_style = "Impact or Bebas Neue"
-    elif niche == "finance":
-        text_color = "#00FF00"  # Green
-        outline_color = "#FFFFFF"  # White
-        font_style = "Montserrat Bold or Arial Black"
-    else:  # luxury
-        text_color = "#FFD700"  # Gold
-        outline_color = "#000000"  # Black
-        font_style = "Playfair Display or Times New Roman Bold"
+    text_color, outline_color, font_style = _OVERLAY_STYLE.get(
+        niche, _OVERLAY_STYLE["luxury"]
+    )
 
     return {
         "recommended_text": thumb_text,
@@ -337,10 +388,5 @@ def create_text_overlay_instructions(
         "placement": "Left third or bottom third",
         "size": "Fill 30-40% of thumbnail width",
         "effects": "Drop shadow, 3-4px outline stroke",
-        "tips": [
-            "Use ALL CAPS for impact",
-            "Maximum 4-5 words visible",
-            "Contrast with background",
-            "Don't cover face if person is in image",
-        ],
+        "tips": list(_OVERLAY_TIPS),
     }
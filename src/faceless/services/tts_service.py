@@ -5,9 +5,14 @@ This service handles generating audio narration for each scene in a script,
 managing voice settings per niche and saving audio files.
 """
 
+import hashlib
+import shutil
+import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from pydantic_core import to_json
+
 from faceless.clients.azure_openai import AzureOpenAIClient
 from faceless.config import get_settings
 from faceless.core.enums import Niche, Voice
@@ -16,6 +21,12 @@ from faceless.core.models import Checkpoint, Scene, Script
 from faceless.utils.logging import LoggerMixin
 
 
+def _audio_cache_key(deployment: str, voice: Voice, speed: float, text: str) -> str:
+    """Hash every input that affects the synthesized audio into a cache key."""
+    payload = to_json([deployment, voice.value, speed, text])
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
 class TTSService(LoggerMixin):
     """
     Service for generating text-to-speech audio.
@@ -40,6 +51,7 @@ class TTSService(LoggerMixin):
         """
         self._client = client or AzureOpenAIClient()
         self._settings = get_settings()
+        self._cache_dir = self._settings.tts_cache_dir
 
     def generate_for_scene(
         self,
@@ -84,12 +96,7 @@ class TTSService(LoggerMixin):
         )
 
         try:
-            self._client.save_audio(
-                text=scene.narration,
-                output_path=output_path,
-                voice=voice,
-                speed=speed,
-            )
+            self._save_audio(scene.narration, output_path, voice, speed)
             scene.audio_path = output_path
             return output_path
 
@@ -101,6 +108,49 @@ class TTSService(LoggerMixin):
                 api_error=str(e),
             ) from e
 
+    def _save_audio(
+        self,
+        text: str,
+        output_path: Path,
+        voice: Voice,
+        speed: float,
+    ) -> None:
+        """
+        Synthesize narration to a file, reusing cached audio when available.
+
+        With tts_cache_dir set, clips are stored as ``{key}.mp3`` keyed by
+        deployment, voice, speed and text, so re-runs of unchanged scenes
+        copy the earlier clip instead of calling the TTS endpoint.
+        """
+        if self._cache_dir is None:
+            self._client.save_audio(
+                text=text, output_path=output_path, voice=voice, speed=speed
+            )
+            return
+
+        key = _audio_cache_key(
+            self._settings.azure_openai.tts_deployment, voice, speed, text
+        )
+        cache_path = self._cache_dir / f"{key}.mp3"
+        if cache_path.exists():
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cache_path, output_path)
+            self.logger.info("Reusing cached audio", path=str(output_path))
+            return
+
+        self._client.save_audio(
+            text=text, output_path=output_path, voice=voice, speed=speed
+        )
+        # Unique per writer, so concurrent writes of one key never share a file
+        tmp_path = cache_path.with_name(f"{key}.{uuid.uuid4().hex}.tmp")
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, tmp_path)
+            # Atomic rename so concurrent readers never see a partial clip
+            tmp_path.replace(cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
     def generate_for_script(
         self,
         script: Script,
@@ -112,6 +162,7 @@ class TTSService(LoggerMixin):
         Generate audio for all scenes in a script using parallel processing.
 
         Generates up to MAX_CONCURRENT_TTS (5) audio files simultaneously.
+        Scenes with identical narration are synthesized once and copied.
 
         Args:
             script: Script with scenes
@@ -169,66 +220,79 @@ class TTSService(LoggerMixin):
             speed=speed,
         )
 
+        # Scenes with identical narration share one synthesis
+        narration_groups: dict[str, list[Scene]] = {}
+        for scene in scenes_to_generate:
+            narration_groups.setdefault(scene.narration, []).append(scene)
+
         # Helper function for thread pool
         def generate_single_audio(
-            scene_number: int,
+            scene_numbers: list[int],
             narration: str,
-        ) -> tuple[int, Path | None, str | None]:
-            """Generate audio for a single scene."""
-            filename = f"scene_{scene_number:02d}.mp3"
-            output_path = output_dir / filename
+        ) -> list[tuple[int, Path | None, str | None]]:
+            """Generate audio once and copy it to every scene sharing it."""
+            first, *duplicates = scene_numbers
+            output_path = output_dir / f"scene_{first:02d}.mp3"
 
             self.logger.info(
                 "Generating audio",
-                scene_number=scene_number,
+                scene_number=first,
                 voice=voice.value,
                 speed=speed,
                 text_length=len(narration),
+                shared_with=duplicates,
             )
 
             try:
-                self._client.save_audio(
-                    text=narration,
-                    output_path=output_path,
-                    voice=voice,
-                    speed=speed,
-                )
-                return (scene_number, output_path, None)
+                self._save_audio(narration, output_path, voice, speed)
             except Exception as e:
-                return (scene_number, None, str(e))
+                return [(number, None, str(e)) for number in scene_numbers]
+
+            results: list[tuple[int, Path | None, str | None]] = [
+                (first, output_path, None)
+            ]
+            for number in duplicates:
+                duplicate_path = output_dir / f"scene_{number:02d}.mp3"
+                try:
+                    shutil.copyfile(output_path, duplicate_path)
+                    results.append((number, duplicate_path, None))
+                except OSError as e:
+                    results.append((number, None, str(e)))
+            return results
 
         # Generate audio in parallel
         with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
-            future_to_scene = {
+            future_to_scenes = {
                 executor.submit(
                     generate_single_audio,
-                    scene.scene_number,
-                    scene.narration,
-                ): scene
-                for scene in scenes_to_generate
+                    [scene.scene_number for scene in group],
+                    narration,
+                ): group
+                for narration, group in narration_groups.items()
             }
 
-            for future in as_completed(future_to_scene):
-                original_scene = future_to_scene[future]
-                scene_number, path, error = future.result()
-
-                if path:
-                    original_scene.audio_path = path
-                    generated_paths.append(path)
-                    if checkpoint:
-                        checkpoint.mark_audio_done(scene_number)
-                    self.logger.info(
-                        "Audio generated",
-                        scene_number=scene_number,
-                        path=str(path),
-                    )
-                else:
-                    self.logger.error(
-                        "Scene audio generation failed",
-                        scene_number=scene_number,
-                        error=error,
-                    )
-                    errors.append(f"Scene {scene_number}: {error}")
+            for future in as_completed(future_to_scenes):
+                group = future_to_scenes[future]
+                for original_scene, (scene_number, path, error) in zip(
+                    group, future.result(), strict=True
+                ):
+                    if path:
+                        original_scene.audio_path = path
+                        generated_paths.append(path)
+                        if checkpoint:
+                            checkpoint.mark_audio_done(scene_number)
+                        self.logger.info(
+                            "Audio generated",
+                            scene_number=scene_number,
+                            path=str(path),
+                        )
+                    else:
+                        self.logger.error(
+                            "Scene audio generation failed",
+                            scene_number=scene_number,
+                            error=error,
+                        )
+                        errors.append(f"Scene {scene_number}: {error}")
 
         if errors:
             self.logger.warning(
@@ -10,8 +10,9 @@ Tests cover:
 - Utility methods
 """
 
+import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -20,6 +21,8 @@ from faceless.core.exceptions import (
     AzureOpenAIError,
     ContentFilterError,
     ImageGenerationError,
+    RateLimitError,
+    RequestTimeoutError,
     TTSGenerationError,
 )
 
@@ -85,6 +88,20 @@ class TestAzureOpenAIClient:
         assert "openai/deployments/gpt-4o/chat/completions" in url
         assert "api-version=2024-08-01-preview" in url
 
+    def test_deployment_urls_built_at_init(
+        self, mock_settings, mock_base_client
+    ) -> None:
+        """Test deployment URLs are built once from settings."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        client = AzureOpenAIClient()
+
+        assert client._chat_url == (
+            "openai/deployments/gpt-4o/chat/completions?api-version=2024-08-01-preview"
+        )
+        assert "deployments/gpt-image-1/images/generations" in client._image_url
+        assert "deployments/gpt-4o-mini-tts/audio/speech" in client._speech_url
+
     def test_handle_error_response_400_content_filter(
         self, mock_settings, mock_base_client
     ) -> None:
@@ -218,6 +235,90 @@ class TestAzureOpenAIClient:
 
         assert result == b"fake_image_data"
 
+    def test_generate_image_requests_base64_for_dalle(
+        self, mock_settings, mock_base_client
+    ) -> None:
+        """Test DALL-E deployments ask for inline base64 instead of a URL."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": [{"b64_json": "aW1n"}]}
+
+        client = AzureOpenAIClient()
+        client._post = MagicMock(return_value=mock_response)
+        client.generate_image("A cat")
+        assert "response_format" not in client._post.call_args[1]["json"]
+
+        mock_settings.azure_openai.image_deployment = "dall-e-3"
+        client = AzureOpenAIClient()
+        client._post = MagicMock(return_value=mock_response)
+        assert client.generate_image("A cat") == b"img"
+        assert client._post.call_args[1]["json"]["response_format"] == "b64_json"
+
+    def test_generate_image_retries_transient_status(
+        self, mock_settings, mock_base_client
+    ) -> None:
+        """Test image requests back off and retry on throttling and 5xx."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = {"data": [{"b64_json": "aW1n"}]}
+        unavailable = MagicMock(status_code=503)
+
+        client = AzureOpenAIClient()
+        client._post = MagicMock(
+            side_effect=[
+                RateLimitError("Rate limit exceeded", retry_after=7),
+                unavailable,
+                ok,
+            ]
+        )
+
+        with patch("tenacity.nap.time.sleep") as mock_sleep:
+            assert client.generate_image("A cat") == b"img"
+
+        assert client._post.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [7, 2]
+        timeout = client._post.call_args[1]["timeout"]
+        assert timeout.connect == 10.0
+
+    def test_media_retry_caps_retry_after(
+        self, mock_settings, mock_base_client
+    ) -> None:
+        """Test a huge Retry-After is capped and the last error is raised."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+        from faceless.clients.base import RETRY_MAX_WAIT
+
+        client = AzureOpenAIClient()
+        client._enable_retry = True
+        client._max_retries = 2
+        client._post = MagicMock(
+            side_effect=RateLimitError("Rate limit exceeded", retry_after=3600)
+        )
+
+        with (
+            patch("tenacity.nap.time.sleep") as mock_sleep,
+            pytest.raises(ImageGenerationError, match="Rate limit"),
+        ):
+            client.generate_image("A cat")
+
+        assert client._post.call_count == 2
+        mock_sleep.assert_called_once_with(RETRY_MAX_WAIT)
+
+    def test_generate_speech_no_retry_when_disabled(self, mock_base_client) -> None:
+        """Test transient failures are not retried when retries are disabled."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        client = AzureOpenAIClient()
+        client._enable_retry = False
+        client._post = MagicMock(return_value=MagicMock(status_code=503, text=""))
+
+        with pytest.raises(AzureOpenAIError):
+            client.generate_speech("Hello")
+
+        client._post.assert_called_once()
+
     def test_generate_image_no_data(self, mock_settings, mock_base_client) -> None:
         """Test image generation with no data in response."""
         from faceless.clients.azure_openai import AzureOpenAIClient
@@ -281,6 +382,56 @@ class TestAzureOpenAIClient:
 
         assert result == "Hello! How can I help?"
 
+    def test_chat_records_cached_token_usage(
+        self, mock_settings, mock_base_client
+    ) -> None:
+        """Test prompt-cache hits from usage are accumulated."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        client = AzureOpenAIClient()
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "Hi"}}],
+            "usage": {
+                "prompt_tokens": 2000,
+                "completion_tokens": 50,
+                "prompt_tokens_details": {"cached_tokens": 1536},
+            },
+        }
+        client._post = MagicMock(return_value=mock_response)
+
+        client.chat([{"role": "user", "content": "Hi"}])
+        client.chat([{"role": "user", "content": "Hi"}])
+
+        assert client.token_usage == {
+            "prompt_tokens": 4000,
+            "cached_tokens": 3072,
+            "completion_tokens": 100,
+        }
+
+    def test_chat_reports_usage_to_caller(
+        self, mock_settings, mock_base_client
+    ) -> None:
+        """Test a caller-supplied usage dict receives the response's usage."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        client = AzureOpenAIClient()
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "{}"}}],
+            "usage": {"prompt_tokens": 20, "completion_tokens": 5},
+        }
+        client._post = MagicMock(return_value=mock_response)
+
+        usage: dict[str, int] = {}
+        client.chat_json("system", "user", usage=usage)
+
+        assert usage["completion_tokens"] == 5
+
     def test_chat_with_response_format(self, mock_settings, mock_base_client) -> None:
         """Test chat with response format."""
         from faceless.clients.azure_openai import AzureOpenAIClient
@@ -319,6 +470,207 @@ class TestAzureOpenAIClient:
         result = client.chat_json("You are a helper", "Return JSON")
 
         assert result == {"name": "test", "value": 123}
+        payload = json.loads(client._post.call_args.kwargs["content"])
+        assert payload["response_format"] == {"type": "json_object"}
+
+    def test_chat_json_with_schema(self, mock_settings, mock_base_client) -> None:
+        """Test chat_json requests strict structured output for a schema."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        client = AzureOpenAIClient()
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": '{"name": "test"}'}}]
+        }
+        client._post = MagicMock(return_value=mock_response)
+
+        schema = {"name": "thing", "schema": {"type": "object"}}
+        client.chat_json("You are a helper", "Return JSON", json_schema=schema)
+
+        payload = json.loads(client._post.call_args.kwargs["content"])
+        assert payload["response_format"] == {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "thing",
+                "schema": {"type": "object"},
+                "strict": True,
+            },
+        }
+
+    def test_chat_json_falls_back_when_schema_unsupported(
+        self, mock_settings, mock_base_client
+    ) -> None:
+        """Test a json_schema rejection retries in JSON mode and sticks."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        client = AzureOpenAIClient()
+
+        rejected = MagicMock()
+        rejected.status_code = 400
+        rejected.json.return_value = {
+            "error": {
+                "code": "BadRequest",
+                "message": "response_format value json_schema is not supported",
+            }
+        }
+        ok = MagicMock()
+        ok.status_code = 200
+        ok.json.return_value = {"choices": [{"message": {"content": '{"a": 1}'}}]}
+        client._post = MagicMock(side_effect=[rejected, ok, ok])
+
+        schema = {"name": "thing", "schema": {"type": "object"}}
+        result = client.chat_json("You are a helper", "Return JSON", json_schema=schema)
+        client.chat_json("You are a helper", "Return JSON", json_schema=schema)
+
+        assert result == {"a": 1}
+        formats = [
+            json.loads(call.kwargs["content"])["response_format"]["type"]
+            for call in client._post.call_args_list
+        ]
+        assert formats == ["json_schema", "json_object", "json_object"]
+
+    def test_chat_json_reraises_other_bad_requests(
+        self, mock_settings, mock_base_client
+    ) -> None:
+        """Test unrelated 400s are not retried in JSON mode."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        client = AzureOpenAIClient()
+
+        rejected = MagicMock()
+        rejected.status_code = 400
+        rejected.json.return_value = {
+            "error": {"code": "BadRequest", "message": "max_tokens is too large"}
+        }
+        client._post = MagicMock(return_value=rejected)
+
+        schema = {"name": "thing", "schema": {"type": "object"}}
+        with pytest.raises(AzureOpenAIError, match="max_tokens"):
+            client.chat_json("You are a helper", "Return JSON", json_schema=schema)
+
+        assert client._post.call_count == 1
+        assert client._structured_outputs
+
+    def test_chat_passes_adaptive_timeout(
+        self, mock_settings, mock_base_client
+    ) -> None:
+        """Test chat sends a timeout scaled to the request size."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        client = AzureOpenAIClient()
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"choices": [{"message": {"content": "ok"}}]}
+        client._post = MagicMock(return_value=mock_response)
+
+        client.chat([{"role": "user", "content": "x" * 20000}], max_tokens=500)
+
+        timeout = client._post.call_args.kwargs["timeout"]
+        assert timeout.connect == 10.0
+        assert timeout.read == 30.0 + 10.0 + 10.0
+
+    def test_estimate_chat_timeout_is_capped(self) -> None:
+        """Test the adaptive timeout never exceeds the maximum."""
+        from faceless.clients.azure_openai import (
+            MAX_CHAT_TIMEOUT,
+            estimate_chat_timeout,
+        )
+
+        assert estimate_chat_timeout(10_000_000, 16000).read == MAX_CHAT_TIMEOUT
+
+    def test_chat_retries_on_timeout(self, mock_settings, mock_base_client) -> None:
+        """Test chat retries a timed out request."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        client = AzureOpenAIClient()
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"choices": [{"message": {"content": "ok"}}]}
+        client._post = MagicMock(
+            side_effect=[RequestTimeoutError("Request timeout"), mock_response]
+        )
+
+        result = client.chat([{"role": "user", "content": "Hi"}])
+
+        assert result == "ok"
+        assert client._post.call_count == 2
+
+    def test_chat_gives_up_after_timeout_retries(
+        self, mock_settings, mock_base_client
+    ) -> None:
+        """Test chat raises once timeout retries are exhausted."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        client = AzureOpenAIClient()
+        client._post = MagicMock(side_effect=RequestTimeoutError("Request timeout"))
+
+        with pytest.raises(AzureOpenAIError, match="timeout"):
+            client.chat([{"role": "user", "content": "Hi"}])
+
+        assert client._post.call_count == 3
+
+    async def test_achat_json(self, mock_settings, mock_base_client) -> None:
+        """Test async chat_json method."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        client = AzureOpenAIClient()
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": '{"name": "test"}'}}]
+        }
+
+        client._apost = AsyncMock(return_value=mock_response)
+
+        result = await client.achat_json("You are a helper", "Return JSON")
+
+        assert result == {"name": "test"}
+        payload = json.loads(client._apost.call_args.kwargs["content"])
+        assert payload["response_format"] == {"type": "json_object"}
+
+    async def test_achat_json_falls_back_when_schema_unsupported(
+        self, mock_settings, mock_base_client
+    ) -> None:
+        """Test async JSON calls retry in JSON mode on a json_schema rejection."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        client = AzureOpenAIClient()
+
+        rejected = MagicMock()
+        rejected.status_code = 400
+        rejected.json.return_value = {
+            "error": {"message": "Invalid parameter: 'response_format' of type"}
+        }
+        ok = MagicMock()
+        ok.status_code = 200
+        ok.json.return_value = {"choices": [{"message": {"content": '{"a": 1}'}}]}
+        client._apost = AsyncMock(side_effect=[rejected, ok])
+
+        schema = {"name": "thing", "schema": {"type": "object"}}
+        result = await client.achat_json(
+            "You are a helper", "Return JSON", json_schema=schema
+        )
+
+        assert result == {"a": 1}
+        payload = json.loads(client._apost.call_args.kwargs["content"])
+        assert payload["response_format"] == {"type": "json_object"}
+
+    async def test_achat_generic_exception(
+        self, mock_settings, mock_base_client
+    ) -> None:
+        """Test async chat wraps unexpected errors."""
+        from faceless.clients.azure_openai import AzureOpenAIClient
+
+        client = AzureOpenAIClient()
+        client._apost = AsyncMock(side_effect=ValueError("boom"))
+
+        with pytest.raises(AzureOpenAIError, match="Chat completion failed"):
+            await client.achat([{"role": "user", "content": "Hi"}])
 
     def test_generate_speech_success(self, mock_settings, mock_base_client) -> None:
         """Test successful speech generation."""
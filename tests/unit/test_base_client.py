@@ -14,8 +14,9 @@ from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
+import respx
 
-from faceless.core.exceptions import ClientError, RateLimitError
+from faceless.core.exceptions import ClientError, RateLimitError, RequestTimeoutError
 
 
 class TestBaseHTTPClient:
@@ -76,6 +77,26 @@ class TestBaseHTTPClient:
         client = BaseHTTPClient(headers=headers)
         assert client._default_headers == headers
 
+    def test_init_uses_pool_limits(self, mock_settings, mock_httpx_client) -> None:
+        """Test the client gets keep-alive pool limits without a custom transport."""
+        from faceless.clients.base import POOL_LIMITS, BaseHTTPClient
+
+        BaseHTTPClient()
+
+        kwargs = mock_httpx_client.call_args.kwargs
+        assert kwargs["limits"] is POOL_LIMITS
+        assert "transport" not in kwargs
+
+    def test_client_keeps_env_proxy_support(self, mock_settings) -> None:
+        """Test HTTP(S)_PROXY from the environment is still honoured."""
+        from faceless.clients.base import BaseHTTPClient
+
+        with patch.dict("os.environ", {"HTTPS_PROXY": "http://proxy.local:3128"}):
+            client = BaseHTTPClient()
+
+        assert any(pattern.pattern == "https://" for pattern in client._client._mounts)
+        client.close()
+
     def test_build_url_with_path(self, mock_settings, mock_httpx_client) -> None:
         """Test URL building with relative path."""
         from faceless.clients.base import BaseHTTPClient
@@ -183,6 +204,8 @@ class TestBaseHTTPClient:
             client._request("GET", "/test")
 
         assert "timeout" in str(exc_info.value).lower()
+        assert isinstance(exc_info.value, RequestTimeoutError)
+        assert exc_info.value.timeout == 120
 
     def test_request_network_error(self, mock_settings, mock_httpx_client) -> None:
         """Test network error handling."""
@@ -303,6 +326,82 @@ class TestBaseHTTPClient:
 
         assert result == b"\x00\x01\x02"
 
+    async def test_arequest_success(self, mock_settings, mock_httpx_client) -> None:
+        """Test async request uses a lazily created async client."""
+        from faceless.clients.base import BaseHTTPClient
+
+        client = BaseHTTPClient(base_url="https://api.example.com")
+        assert client._async_client is None
+
+        with respx.mock:
+            respx.post("https://api.example.com/test").respond(200, json={"ok": 1})
+            response = await client._apost("/test", json={})
+
+        assert response.status_code == 200
+        assert client._async_client is not None
+        await client.aclose()
+        assert client._async_client is None
+
+    async def test_arequest_rate_limit(self, mock_settings, mock_httpx_client) -> None:
+        """Test async rate limit handling."""
+        from faceless.clients.base import BaseHTTPClient
+
+        client = BaseHTTPClient(base_url="https://api.example.com")
+
+        with respx.mock:
+            respx.post("https://api.example.com/test").respond(
+                429, headers={"Retry-After": "30"}
+            )
+            with pytest.raises(RateLimitError) as exc_info:
+                await client._apost("/test")
+
+        assert exc_info.value.retry_after == 30
+        await client.aclose()
+
+    async def test_arequest_timeout_error(
+        self, mock_settings, mock_httpx_client
+    ) -> None:
+        """Test async timeout error handling."""
+        from faceless.clients.base import BaseHTTPClient
+
+        client = BaseHTTPClient(base_url="https://api.example.com")
+
+        with respx.mock:
+            respx.post("https://api.example.com/test").mock(
+                side_effect=httpx.ReadTimeout("Timeout")
+            )
+            with pytest.raises(ClientError, match="timeout"):
+                await client._apost("/test")
+
+        await client.aclose()
+
+
+class TestSharedClient:
+    """Tests for SharedClient."""
+
+    def test_client_created_once(self) -> None:
+        """Test the client is created lazily and then reused."""
+        from faceless.clients.base import SharedClient
+
+        shared = SharedClient(timeout=5.0, headers={"User-Agent": "test"})
+        assert shared._client is None
+
+        client = shared.get()
+
+        assert shared.get() is client
+        assert client.headers["User-Agent"] == "test"
+        client.close()
+
+    def test_client_keeps_env_proxy_support(self) -> None:
+        """Test HTTP(S)_PROXY from the environment is still honoured."""
+        from faceless.clients.base import SharedClient
+
+        with patch.dict("os.environ", {"HTTPS_PROXY": "http://proxy.local:3128"}):
+            client = SharedClient(timeout=5.0).get()
+
+        assert any(pattern.pattern == "https://" for pattern in client._mounts)
+        client.close()
+
 
 class TestWithRetry:
     """Tests for the with_retry decorator."""
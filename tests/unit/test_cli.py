@@ -10,6 +10,7 @@ Tests cover:
 - Info command
 """
 
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -527,6 +528,41 @@ class TestValidateTestConnections:
                 or "Connection failed" in result.output
             )
 
+    def test_validate_connection_check_overlaps_ffmpeg_probe(self) -> None:
+        """Test the API check is already running while FFmpeg is probed."""
+        connection_started = threading.Event()
+
+        def test_connection() -> bool:
+            connection_started.set()
+            return True
+
+        def probe_ffmpeg(*args, **kwargs) -> MagicMock:
+            # Sequential checks would leave the event unset and fail the probe
+            started = connection_started.wait(timeout=5)
+            return MagicMock(returncode=0 if started else 1)
+
+        with (
+            patch("faceless.cli.commands.get_settings") as mock_settings,
+            patch("faceless.cli.commands.setup_logging"),
+            patch("subprocess.run", side_effect=probe_ffmpeg),
+            patch(
+                "faceless.clients.azure_openai.AzureOpenAIClient"
+            ) as mock_client_class,
+        ):
+            settings = MagicMock()
+            settings.log_level = "INFO"
+            settings.log_json_format = False
+            settings.azure_openai.is_configured = True
+            settings.use_elevenlabs = False
+            mock_settings.return_value = settings
+            mock_client_class.return_value.test_connection.side_effect = test_connection
+
+            result = runner.invoke(app, ["validate", "--test-connections"])
+
+            assert result.exit_code == 0
+            assert "Installed" in result.output
+            assert "Connected" in result.output
+
     def test_validate_test_connections_exception(self) -> None:
         """Test validate with exception during test connections."""
         with (
@@ -8,8 +8,9 @@ Tests cover:
 - Error handling
 """
 
+import json
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -25,6 +26,7 @@ class TestEnhancerService:
         """Mock settings."""
         with patch("faceless.services.enhancer_service.get_settings") as mock:
             settings = MagicMock()
+            settings.enhance_cache_dir = None
             mock.return_value = settings
             yield settings
 
@@ -179,6 +181,109 @@ class TestEnhancerService:
         assert result is not None
         mock_client.chat_json.assert_called_once()
 
+    def test_enhance_script_requests_structured_output(
+        self, enhancer_service, mock_client, sample_script
+    ) -> None:
+        """Test enhancement sends the schema instead of an inline example."""
+        from faceless.services.enhancer_service import ENHANCED_SCRIPT_SCHEMA
+
+        mock_client.chat_json.return_value = {"title": "T", "scenes": []}
+
+        enhancer_service.enhance_script(sample_script)
+
+        call_kwargs = mock_client.chat_json.call_args.kwargs
+        assert call_kwargs["json_schema"] is ENHANCED_SCRIPT_SCHEMA
+        assert "Return a JSON object" not in call_kwargs["user_prompt"]
+
+    def test_enhance_script_caps_max_tokens_by_script_size(
+        self, enhancer_service, mock_client, sample_script
+    ) -> None:
+        """Test short scripts get a tighter output budget than the maximum."""
+        from faceless.services.enhancer_service import ENHANCE_MAX_TOKENS
+
+        mock_client.chat_json.return_value = {"title": "T", "scenes": []}
+
+        enhancer_service.enhance_script(sample_script)
+
+        max_tokens = mock_client.chat_json.call_args.kwargs["max_tokens"]
+        assert 0 < max_tokens < ENHANCE_MAX_TOKENS
+
+    def test_enhance_script_learns_max_tokens_per_niche(
+        self, enhancer_service, mock_client, sample_script
+    ) -> None:
+        """Test reported completion sizes raise later budgets in the niche."""
+
+        def respond(**kwargs):
+            kwargs["usage"]["completion_tokens"] = 900
+            return {"title": "T", "scenes": []}
+
+        mock_client.chat_json.side_effect = respond
+
+        enhancer_service.enhance_script(sample_script)
+        enhancer_service.enhance_script(
+            sample_script.model_copy(update={"title": "Another"})
+        )
+
+        first, second = (
+            c.kwargs["max_tokens"] for c in mock_client.chat_json.call_args_list
+        )
+        assert first < second
+
+    def test_learned_hint_never_lowers_budget_for_longer_script(
+        self, enhancer_service, mock_client, sample_script
+    ) -> None:
+        """Test a long script after short ones still gets its full estimate."""
+        from faceless.services.enhancer_service import _enhancement_max_tokens
+
+        def respond(**kwargs):
+            kwargs["usage"]["completion_tokens"] = 40
+            return {"title": "T", "scenes": []}
+
+        mock_client.chat_json.side_effect = respond
+
+        for title in ("Short one", "Short two"):
+            enhancer_service.enhance_script(
+                sample_script.model_copy(update={"title": title})
+            )
+
+        long_script = sample_script.model_copy(deep=True, update={"title": "Long"})
+        for scene in long_script.scenes:
+            scene.narration = "A much longer scene narration. " * 20
+        enhancer_service.enhance_script(long_script)
+
+        max_tokens = mock_client.chat_json.call_args.kwargs["max_tokens"]
+        assert max_tokens == _enhancement_max_tokens(long_script)
+
+    def test_enhancement_max_tokens_is_bounded(self, sample_script) -> None:
+        """Test long scripts never exceed the maximum output budget."""
+        from faceless.services.enhancer_service import (
+            ENHANCE_MAX_TOKENS,
+            _enhancement_max_tokens,
+        )
+
+        sample_script.scenes[0].narration = "word " * 5000
+
+        assert _enhancement_max_tokens(sample_script) == ENHANCE_MAX_TOKENS
+
+    def test_enhance_script_ignores_style_when_not_requested(
+        self, enhancer_service, mock_client, sample_script
+    ) -> None:
+        """Test a schema-forced visual style is dropped if not requested."""
+        mock_client.chat_json.return_value = {
+            "title": "T",
+            "visual_style": {
+                "environment": "Forest",
+                "color_mood": "",
+                "texture": "",
+                "recurring_elements": [],
+            },
+            "scenes": [],
+        }
+
+        result = enhancer_service.enhance_script(sample_script, add_visual_style=False)
+
+        assert result.visual_style is None
+
     def test_enhance_script_sets_enhanced_at(
         self, enhancer_service, mock_client, sample_script
     ) -> None:
@@ -220,6 +325,36 @@ class TestEnhancerService:
 
         assert "narration" in prompt.lower()
 
+    def test_build_enhancement_prompt_static_prefix(
+        self, enhancer_service, sample_script
+    ) -> None:
+        """Test prompts for different scripts share everything before the data."""
+        other = sample_script.model_copy(
+            update={"title": "Other", "niche": Niche.FINANCE}
+        )
+
+        first = enhancer_service._build_enhancement_prompt(
+            sample_script, True, True, True
+        )
+        second = enhancer_service._build_enhancement_prompt(other, True, True, True)
+
+        prefix = first[: first.index("Script:")]
+        assert second.startswith(prefix)
+        assert "scary-stories" not in prefix
+
+    def test_build_enhancement_prompt_embeds_scenes_as_json(
+        self, enhancer_service, sample_script
+    ) -> None:
+        """Test scene data with braces and quotes is embedded as valid JSON."""
+        sample_script.scenes[0].narration = 'He whispered "{name}" twice.'
+
+        prompt = enhancer_service._build_enhancement_prompt(
+            sample_script, True, True, True
+        )
+
+        scenes = json.loads(prompt.split("Scenes: ", 1)[1])
+        assert scenes[0]["narration"] == 'He whispered "{name}" twice.'
+
     def test_apply_enhancements(self, enhancer_service, sample_script) -> None:
         """Test applying enhancements to script."""
         enhancements = {
@@ -244,9 +379,30 @@ class TestEnhancerService:
         assert result.title == "New Title"
         assert result.scenes[0].narration == "New narration 1"
         assert result.visual_style.environment == "Foggy forest"
+        assert result.visual_style.recurring_elements == {"tree": "Ancient oak"}
         # Scene 2 should keep original
         assert result.scenes[1].narration == sample_script.scenes[1].narration
 
+    def test_apply_enhancements_recurring_elements_list(
+        self, enhancer_service, sample_script
+    ) -> None:
+        """Test schema-style recurring elements are converted to a dict."""
+        enhancements = {
+            "visual_style": {
+                "environment": "Foggy forest",
+                "color_mood": "Dark greens",
+                "texture": "Moss",
+                "recurring_elements": [
+                    {"name": "tree", "description": "Ancient oak"},
+                ],
+            },
+            "scenes": [],
+        }
+
+        result = enhancer_service._apply_enhancements(sample_script, enhancements)
+
+        assert result.visual_style.recurring_elements == {"tree": "Ancient oak"}
+
     def test_apply_enhancements_preserves_metadata(
         self, enhancer_service, sample_script
     ) -> None:
@@ -278,6 +434,25 @@ class TestEnhancerService:
         assert result.color_mood == "Deep purples and blacks"
         assert "ghost" in result.recurring_elements
 
+    def test_generate_visual_style_uses_shared_schema(
+        self, enhancer_service, mock_client, sample_script
+    ) -> None:
+        """Test visual style generation sends the shared schema."""
+        from faceless.services.enhancer_service import VISUAL_STYLE_SCHEMA
+
+        mock_client.chat_json.return_value = {
+            "environment": "Attic",
+            "color_mood": "Sepia",
+            "texture": "Dust",
+            "recurring_elements": [{"name": "doll", "description": "Cracked"}],
+        }
+
+        result = enhancer_service.generate_visual_style(sample_script)
+
+        json_schema = mock_client.chat_json.call_args.kwargs["json_schema"]
+        assert json_schema["schema"] is VISUAL_STYLE_SCHEMA
+        assert result.recurring_elements == {"doll": "Cracked"}
+
     def test_generate_visual_style_error_returns_empty(
         self, enhancer_service, mock_client, sample_script
     ) -> None:
@@ -304,3 +479,247 @@ class TestEnhancerService:
         assert result.environment == "Dark forest"
         assert result.color_mood == ""
         assert result.texture == ""
+
+    def test_enhance_scripts(
+        self, enhancer_service, mock_client, mock_settings, sample_script
+    ) -> None:
+        """Test batch enhancement preserves input order."""
+        mock_settings.max_concurrent_enhancements = 2
+        mock_client.achat_json = AsyncMock(
+            return_value={"title": "Enhanced", "scenes": []}
+        )
+        mock_client.aclose = AsyncMock()
+        other = sample_script.model_copy(update={"title": "Other"})
+
+        result = enhancer_service.enhance_scripts([sample_script, other])
+
+        assert [s.title for s in result] == ["Enhanced", "Enhanced"]
+        assert all(s.enhanced_at is not None for s in result)
+        mock_client.aclose.assert_awaited_once()
+
+    async def test_aenhance_script_returns_original_on_error(
+        self, enhancer_service, mock_client, sample_script
+    ) -> None:
+        """Test async enhancement falls back to the original script."""
+        mock_client.achat_json = AsyncMock(side_effect=Exception("API Error"))
+
+        result = await enhancer_service.aenhance_script(sample_script)
+
+        assert result is sample_script
+
+    def test_enhance_script_skips_recently_failed_prompt(
+        self, enhancer_service, mock_client, sample_script
+    ) -> None:
+        """Test an unparseable response is not re-requested right away."""
+        mock_client.chat_json.side_effect = ValueError("EOF while parsing")
+
+        first = enhancer_service.enhance_script(sample_script)
+        second = enhancer_service.enhance_script(sample_script)
+
+        assert first is sample_script
+        assert second is sample_script
+        mock_client.chat_json.assert_called_once()
+
+    def test_enhance_script_rejects_malformed_response(
+        self, enhancer_service, mock_client, sample_script
+    ) -> None:
+        """Test a response with malformed scenes is treated as a failed prompt."""
+        mock_client.chat_json.return_value = {
+            "title": "Enhanced",
+            "scenes": [{"narration": "No scene number", "image_prompt": "p"}],
+        }
+
+        first = enhancer_service.enhance_script(sample_script)
+        second = enhancer_service.enhance_script(sample_script)
+
+        assert first is sample_script
+        assert second is sample_script
+        mock_client.chat_json.assert_called_once()
+
+    def test_enhance_script_retries_after_api_error(
+        self, enhancer_service, mock_client, sample_script
+    ) -> None:
+        """Test non-parse failures are not remembered."""
+        mock_client.chat_json.side_effect = Exception("API Error")
+
+        enhancer_service.enhance_script(sample_script)
+        enhancer_service.enhance_script(sample_script)
+
+        assert mock_client.chat_json.call_count == 2
+
+    def test_enhance_script_reuses_persisted_result(
+        self, mock_settings, mock_client, sample_script, tmp_path
+    ) -> None:
+        """Test a new service reuses results persisted by an earlier one."""
+        from faceless.services.enhancer_service import EnhancerService
+
+        mock_settings.enhance_cache_dir = tmp_path
+        mock_client.chat_json.return_value = {"title": "Enhanced", "scenes": []}
+
+        EnhancerService(client=mock_client).enhance_script(sample_script)
+        result = EnhancerService(client=mock_client).enhance_script(sample_script)
+
+        assert result.title == "Enhanced"
+        mock_client.chat_json.assert_called_once()
+
+    def test_enhance_script_reuses_cached_result(
+        self, enhancer_service, mock_client, sample_script
+    ) -> None:
+        """Test re-enhancing an identical script does not call the API again."""
+        mock_client.chat_json.return_value = {"title": "Enhanced", "scenes": []}
+
+        first = enhancer_service.enhance_script(sample_script)
+        second = enhancer_service.enhance_script(sample_script)
+
+        assert first.title == "Enhanced"
+        assert second.title == "Enhanced"
+        mock_client.chat_json.assert_called_once()
+
+
+class TestEnhancementCache:
+    """Tests for EnhancementCache."""
+
+    def test_key_ignores_whitespace(self) -> None:
+        """Test prompts differing only in whitespace share a key."""
+        from faceless.services.enhancer_service import EnhancementCache
+
+        assert EnhancementCache.key_for("a  b\n c") == EnhancementCache.key_for("a b c")
+        assert EnhancementCache.key_for("a b") != EnhancementCache.key_for("a c")
+
+    def test_expires_after_ttl(self) -> None:
+        """Test entries expire after the TTL."""
+        from faceless.services.enhancer_service import EnhancementCache
+
+        cache = EnhancementCache(ttl_seconds=0)
+        cache.put("key", {"title": "T"})
+
+        assert cache.get("key") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the least recently used entry is evicted at max size."""
+        from faceless.services.enhancer_service import EnhancementCache
+
+        cache = EnhancementCache(max_size=2)
+        cache.put("a", {"title": "A"})
+        cache.put("b", {"title": "B"})
+        cache.get("a")
+        cache.put("c", {"title": "C"})
+
+        assert cache.get("a") == {"title": "A"}
+        assert cache.get("b") is None
+        assert cache.get("c") == {"title": "C"}
+
+    def test_persists_results_across_instances(self, tmp_path) -> None:
+        """Test results written to cache_dir are found by a fresh cache."""
+        from faceless.services.enhancer_service import EnhancementCache
+
+        EnhancementCache(cache_dir=tmp_path).put("key", {"title": "T"})
+
+        assert EnhancementCache(cache_dir=tmp_path).get("key") == {"title": "T"}
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_reloads_persisted_result_after_memory_expiry(self, tmp_path) -> None:
+        """Test an expired in-memory entry falls back to the disk copy."""
+        from faceless.services.enhancer_service import EnhancementCache
+
+        cache = EnhancementCache(ttl_seconds=0, cache_dir=tmp_path)
+        cache.put("key", {"title": "T"})
+
+        assert cache.get("key") == {"title": "T"}
+
+    def test_concurrent_writers_use_separate_temp_files(self, tmp_path) -> None:
+        """Test each put writes through its own temporary file."""
+        from faceless.services.enhancer_service import EnhancementCache
+
+        cache = EnhancementCache(cache_dir=tmp_path)
+        with patch("pathlib.Path.replace") as mock_replace:
+            cache.put("key", {"title": "A"})
+            cache.put("key", {"title": "B"})
+
+        first, second = (call.args for call in mock_replace.call_args_list)
+        assert first == second == (tmp_path / "key.json",)
+        assert len(set(tmp_path.glob("key.*.tmp"))) == 2
+
+    def test_ignores_unreadable_cache_file(self, tmp_path) -> None:
+        """Test a corrupt persisted entry is treated as a miss."""
+        from faceless.services.enhancer_service import EnhancementCache
+
+        (tmp_path / "key.json").write_text("{not json")
+
+        assert EnhancementCache(cache_dir=tmp_path).get("key") is None
+
+
+class TestFailedPromptCache:
+    """Tests for FailedPromptCache."""
+
+    def test_expires_after_ttl(self) -> None:
+        """Test entries expire after the TTL."""
+        from faceless.services.enhancer_service import FailedPromptCache
+
+        cache = FailedPromptCache(ttl_seconds=0)
+        cache.add("key")
+
+        assert not cache.recently_failed("key")
+
+    def test_evicts_oldest_when_full(self) -> None:
+        """Test the oldest entry is evicted at max size."""
+        from faceless.services.enhancer_service import FailedPromptCache
+
+        cache = FailedPromptCache(max_size=2)
+        for key in ("a", "b", "c"):
+            cache.add(key)
+
+        assert not cache.recently_failed("a")
+        assert cache.recently_failed("b")
+        assert cache.recently_failed("c")
+
+    def test_key_for_is_stable(self) -> None:
+        """Test identical prompts hash to the same key."""
+        from faceless.services.enhancer_service import FailedPromptCache
+
+        assert FailedPromptCache.key_for("prompt") == FailedPromptCache.key_for(
+            "prompt"
+        )
+        assert FailedPromptCache.key_for("a") != FailedPromptCache.key_for("b")
+
+
+class TestCompletionSizeHint:
+    """Tests for CompletionSizeHint."""
+
+    def test_no_budget_before_observation(self) -> None:
+        """Test niches without samples have no learned budget."""
+        from faceless.services.enhancer_service import CompletionSizeHint
+
+        assert CompletionSizeHint().budget(Niche.FINANCE, 5) is None
+
+    def test_budget_follows_moving_average(self) -> None:
+        """Test samples are blended and scaled by headroom and scene count."""
+        from faceless.services.enhancer_service import CompletionSizeHint
+
+        hint = CompletionSizeHint(alpha=0.5, headroom=1.0)
+        hint.observe(Niche.FINANCE, 2, 200)
+        hint.observe(Niche.FINANCE, 2, 400)
+
+        assert hint.budget(Niche.FINANCE, 4) == 600
+        assert hint.budget(Niche.LUXURY, 4) is None
+
+
+class TestEnhancementInstructions:
+    """Tests for the cached enhancement instruction block."""
+
+    def test_instructions_are_cached_per_options(self) -> None:
+        """Test the same options return the same rendered string object."""
+        from faceless.services.enhancer_service import _enhancement_instructions
+
+        first = _enhancement_instructions(True, False, True)
+        second = _enhancement_instructions(True, False, True)
+
+        assert first is second
+        assert "narration" in first
+        assert "image prompts" not in first
+
+    def test_system_prompt_asks_for_json(self) -> None:
+        """Test the prompt still asks for JSON for the JSON-mode fallback."""
+        from faceless.services.enhancer_service import ENHANCE_SYSTEM_PROMPT
+
+        assert "JSON" in ENHANCE_SYSTEM_PROMPT
@@ -30,6 +30,7 @@ from faceless.core.exceptions import (
     PipelineError,
     RateLimitError,
     RedditError,
+    RequestTimeoutError,
     ScriptValidationError,
     TTSGenerationError,
     ValidationError,
@@ -501,6 +502,13 @@ class TestExceptionHierarchy:
         error = RateLimitError("test")
         assert isinstance(error, ClientError)
 
+    def test_request_timeout_is_client_error(self) -> None:
+        """Test RequestTimeoutError inherits from ClientError."""
+        error = RequestTimeoutError("test", timeout=30.0)
+        assert isinstance(error, ClientError)
+        assert error.timeout == 30.0
+        assert error.details["timeout"] == 30.0
+
     def test_content_filter_is_client_error(self) -> None:
         """Test ContentFilterError inherits from ClientError."""
         error = ContentFilterError("test")
@@ -116,6 +116,64 @@ class TestDeepResearchService:
         assert result.confidence_score == 0.85
         mock_client.chat_json.assert_called_once()
 
+    def test_research_topic_requests_structured_output(
+        self, mock_client: MagicMock
+    ) -> None:
+        """Test research sends its schema instead of an inline example."""
+        from faceless.services.research_service import RESEARCH_RESULT_SCHEMA
+
+        service = DeepResearchService(client=mock_client)
+        service.research_topic(topic="Diamonds", niche=Niche.FINANCE)
+
+        call_kwargs = mock_client.chat_json.call_args.kwargs
+        assert call_kwargs["json_schema"] is RESEARCH_RESULT_SCHEMA
+        assert '"key_findings"' not in call_kwargs["user_prompt"]
+        schema = RESEARCH_RESULT_SCHEMA["schema"]
+        assert schema["required"] == list(schema["properties"])
+
+    def test_research_prompts_are_read_only(self) -> None:
+        """Test the shared prompt table cannot be mutated."""
+        from faceless.services.research_service import RESEARCH_PROMPTS
+
+        assert set(RESEARCH_PROMPTS) == set(ResearchDepth)
+        with pytest.raises(TypeError):
+            RESEARCH_PROMPTS[ResearchDepth.QUICK] = "changed"  # type: ignore[index]
+
+    def test_research_prompt_shares_prefix_across_niches(
+        self, mock_client: MagicMock
+    ) -> None:
+        """Test niche- and topic-specific text comes after the static prefix."""
+        service = DeepResearchService(client=mock_client)
+
+        finance = service._build_research_prompt(
+            "Diamonds", Niche.FINANCE, ResearchDepth.STANDARD, ""
+        )
+        history = service._build_research_prompt(
+            "Rome", Niche.HISTORY, ResearchDepth.STANDARD, ""
+        )
+
+        prefix = "Provide your research as JSON matching the research_result schema."
+        assert finance.startswith(prefix)
+        assert history.startswith(prefix)
+        assert finance.rstrip().endswith("Research Topic: Diamonds")
+
+    def test_content_structure_embeds_findings_as_json(
+        self, mock_client: MagicMock
+    ) -> None:
+        """Test findings are embedded as compact JSON, not a Python repr."""
+        research = ResearchOutput(
+            topic="Diamonds", niche=Niche.FINANCE, depth=ResearchDepth.QUICK
+        )
+        research.key_findings.append(
+            ResearchFinding(content='De Beers\' "scarcity"', category="fact")
+        )
+        service = DeepResearchService(client=mock_client)
+
+        service.generate_content_structure(research)
+
+        prompt = mock_client.chat_json.call_args.kwargs["user_prompt"]
+        assert 'Key findings: ["De Beers\' \\"scarcity\\""]' in prompt
+
     def test_research_topic_parses_findings(self, mock_client: MagicMock) -> None:
         """Test that findings are parsed correctly."""
         service = DeepResearchService(client=mock_client)
@@ -365,6 +423,42 @@ class TestQualityService:
 
         assert len(hooks) == 3
         assert "Hook 1" in hooks
+        assert mock_client.chat_json.call_args.kwargs["max_tokens"] < 4000
+
+    def test_check_mid_video_retention_reuses_result(
+        self, mock_client: MagicMock, sample_script: Script
+    ) -> None:
+        """Test an unchanged middle section is not re-analyzed."""
+        mock_client.chat_json.return_value = {"has_mid_hooks": True}
+        scenes = [
+            sample_script.scenes[0].model_copy(update={"scene_number": i})
+            for i in range(1, 4)
+        ]
+        script = sample_script.model_copy(update={"scenes": scenes})
+        service = QualityService(client=mock_client)
+
+        first = service.check_mid_video_retention(script)
+        second = service.check_mid_video_retention(script)
+
+        assert first == second == {"has_mid_hooks": True}
+        mock_client.chat_json.assert_called_once()
+
+    def test_check_mid_video_retention_cache_is_isolated(
+        self, mock_client: MagicMock, sample_script: Script
+    ) -> None:
+        """Test mutating a returned result does not change later cache hits."""
+        mock_client.chat_json.return_value = {"suggestions": ["Add a tease"]}
+        scenes = [
+            sample_script.scenes[0].model_copy(update={"scene_number": i})
+            for i in range(1, 4)
+        ]
+        script = sample_script.model_copy(update={"scenes": scenes})
+        service = QualityService(client=mock_client)
+
+        service.check_mid_video_retention(script)["suggestions"].append("Extra")
+        result = service.check_mid_video_retention(script)
+
+        assert result == {"suggestions": ["Add a tease"]}
 
 
 # =============================================================================
@@ -143,6 +143,60 @@ class TestOrchestratorRun:
 
         assert isinstance(results, list)
 
+    @patch("faceless.pipeline.orchestrator.get_settings")
+    @patch("faceless.pipeline.orchestrator.AzureOpenAIClient")
+    @patch("faceless.pipeline.orchestrator.EnhancerService")
+    @patch("faceless.pipeline.orchestrator.ImageService")
+    @patch("faceless.pipeline.orchestrator.TTSService")
+    @patch("faceless.pipeline.orchestrator.VideoService")
+    def test_run_enhances_multiple_scripts_in_one_batch(
+        self,
+        mock_video: MagicMock,
+        mock_tts: MagicMock,
+        mock_image: MagicMock,
+        mock_enhancer: MagicMock,
+        mock_client: MagicMock,
+        mock_settings: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test several scripts are enhanced together before processing."""
+        from faceless.pipeline.orchestrator import Orchestrator
+
+        settings = MagicMock()
+        settings.enable_checkpointing = False
+        settings.output_base_dir = tmp_path
+        settings.get_scripts_dir.return_value = tmp_path / "scripts"
+        settings.get_checkpoints_dir.return_value = tmp_path / "checkpoints"
+        mock_settings.return_value = settings
+
+        scripts = [
+            Script(
+                title=f"Story {i}",
+                niche=Niche.SCARY_STORIES,
+                scenes=[
+                    Scene(scene_number=1, narration="Text", image_prompt="Prompt")
+                ],
+            )
+            for i in range(2)
+        ]
+        enhancer = mock_enhancer.return_value
+        enhancer.enhance_scripts.side_effect = lambda batch: [
+            s.model_copy(update={"title": f"{s.title} Enhanced"}) for s in batch
+        ]
+
+        orchestrator = Orchestrator()
+        orchestrator._load_existing_scripts = MagicMock(return_value=scripts)
+        orchestrator._process_script = MagicMock(return_value=MagicMock(success=True))
+
+        orchestrator.run(niche=Niche.SCARY_STORIES, count=2, enhance=True)
+
+        enhancer.enhance_scripts.assert_called_once()
+        enhancer.enhance_script.assert_not_called()
+        calls = orchestrator._process_script.call_args_list
+        processed = [c.kwargs["script"].title for c in calls]
+        assert processed == ["Story 0 Enhanced", "Story 1 Enhanced"]
+        assert all(c.kwargs["enhance"] is False for c in calls)
+
 
 # =============================================================================
 # Load Existing Scripts Tests
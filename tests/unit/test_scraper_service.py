@@ -10,6 +10,7 @@ from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 # =============================================================================
@@ -60,6 +61,14 @@ class TestCleanText:
         result = clean_text(text)
         assert result == "Check out this link here"
 
+    def test_clean_nested_markdown(self) -> None:
+        """Test markup inside links and emphasis is stripped too."""
+        from faceless.services.scraper_service import clean_text
+
+        text = "Read [**this** one](https://example.com/a_b_c) and ~~*that*~~"
+        result = clean_text(text)
+        assert result == "Read this one and that"
+
     def test_clean_multiple_newlines(self) -> None:
         """Test collapsing multiple newlines."""
         from faceless.services.scraper_service import clean_text
@@ -94,6 +103,14 @@ class TestCleanText:
         assert "<" in result
         assert ">" in result
 
+    def test_clean_all_html_entities(self) -> None:
+        """Test entities beyond &amp;, &lt; and &gt; are decoded too."""
+        from faceless.services.scraper_service import clean_text
+
+        text = "&quot;Don&#39;t&quot; &amp;lt;"
+        result = clean_text(text)
+        assert result == '"Don\'t" &lt;'
+
     def test_clean_strips_whitespace(self) -> None:
         """Test that result is stripped."""
         from faceless.services.scraper_service import clean_text
@@ -353,8 +370,17 @@ class TestStoryToScript:
 class TestFetchRedditStories:
     """Tests for fetch_reddit_stories with mocked HTTP."""
 
-    @patch("faceless.services.scraper_service.httpx.Client")
-    def test_fetch_reddit_stories_success(self, mock_client_class: MagicMock) -> None:
+    @pytest.fixture(autouse=True)
+    def clear_fetch_cache(self):
+        """Start each test with an empty fetch cache."""
+        from faceless.services import scraper_service
+
+        scraper_service._fetch_cache.clear()
+        yield
+        scraper_service._fetch_cache.clear()
+
+    @patch("faceless.services.scraper_service._get_client")
+    def test_fetch_reddit_stories_success(self, mock_get_client: MagicMock) -> None:
         """Test successful Reddit story fetching."""
         from faceless.services.scraper_service import fetch_reddit_stories
 
@@ -379,9 +405,7 @@ class TestFetchRedditStories:
 
         mock_client = MagicMock()
         mock_client.get.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         stories = fetch_reddit_stories("nosleep", limit=1, min_score=100)
 
@@ -389,9 +413,9 @@ class TestFetchRedditStories:
         assert stories[0]["title"] == "Test Story"
         assert stories[0]["author"] == "test_user"
 
-    @patch("faceless.services.scraper_service.httpx.Client")
+    @patch("faceless.services.scraper_service._get_client")
     def test_fetch_reddit_stories_filters_low_score(
-        self, mock_client_class: MagicMock
+        self, mock_get_client: MagicMock
     ) -> None:
         """Test that low score posts are filtered out."""
         from faceless.services.scraper_service import fetch_reddit_stories
@@ -416,17 +440,15 @@ class TestFetchRedditStories:
 
         mock_client = MagicMock()
         mock_client.get.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         stories = fetch_reddit_stories("nosleep", limit=1, min_score=100)
 
         assert len(stories) == 0
 
-    @patch("faceless.services.scraper_service.httpx.Client")
+    @patch("faceless.services.scraper_service._get_client")
     def test_fetch_reddit_stories_filters_no_content(
-        self, mock_client_class: MagicMock
+        self, mock_get_client: MagicMock
     ) -> None:
         """Test that posts without content are filtered out."""
         from faceless.services.scraper_service import fetch_reddit_stories
@@ -451,14 +473,54 @@ class TestFetchRedditStories:
 
         mock_client = MagicMock()
         mock_client.get.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         stories = fetch_reddit_stories("nosleep", limit=1, min_score=100)
 
         assert len(stories) == 0
 
+    @patch("faceless.services.scraper_service._get_client")
+    def test_fetch_reddit_stories_uses_cache(self, mock_get_client: MagicMock) -> None:
+        """Test a repeat fetch is served from cache as an independent copy."""
+        from faceless.services.scraper_service import fetch_reddit_stories
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "data": {
+                "children": [
+                    {
+                        "data": {
+                            "title": "Cached Story",
+                            "selftext": "Story body.",
+                            "score": 500,
+                            "permalink": "/r/nosleep/cached",
+                        }
+                    },
+                ]
+            }
+        }
+        mock_get_client.return_value.get.return_value = mock_response
+
+        first = fetch_reddit_stories("nosleep", limit=1)
+        first[0]["title"] = "Edited"
+        first.append({"title": "Extra"})
+        second = fetch_reddit_stories("nosleep", limit=1)
+
+        assert [s["title"] for s in second] == ["Cached Story"]
+        mock_get_client.return_value.get.assert_called_once()
+
+    def test_get_client_is_shared(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test one keep-alive client is reused across fetches."""
+        from faceless.services.scraper_service import _get_client
+
+        monkeypatch.setattr(_get_client.__self__, "_client", None)
+        with patch("faceless.clients.base.httpx.Client") as mock_client:
+            assert _get_client() is _get_client()
+
+        mock_client.assert_called_once()
+        headers = mock_client.call_args.kwargs["headers"]
+        assert headers["User-Agent"].startswith("FacelessContent/")
+
 
 # =============================================================================
 # Fetch Creepypasta Tests
@@ -516,6 +578,52 @@ class TestFetchAndProcessStories:
         assert len(result) == 1
         assert result[0].exists()
 
+    @patch("faceless.services.scraper_service.fetch_reddit_stories")
+    def test_fetch_and_process_scary_stories_backfills(
+        self, mock_fetch: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test LetsNotMeet tops up a short nosleep result."""
+        from faceless.services.scraper_service import fetch_and_process_stories
+
+        def fake_fetch(subreddit: str, limit: int) -> list[dict[str, str]]:
+            titles = ["Nosleep One"] if subreddit == "nosleep" else ["LNM1", "LNM2"]
+            return [{"title": t, "content": "Para one.\n\nPara two."} for t in titles]
+
+        mock_fetch.side_effect = fake_fetch
+
+        result = fetch_and_process_stories(
+            "scary-stories", count=2, output_dir=tmp_path
+        )
+
+        assert [p.name for p in result] == [
+            "nosleep-one_script.json",
+            "lnm1_script.json",
+        ]
+        assert {c.args[0] for c in mock_fetch.call_args_list} == {
+            "nosleep",
+            "LetsNotMeet",
+        }
+
+    @patch("faceless.services.scraper_service.fetch_reddit_stories")
+    def test_fetch_and_process_scary_stories_backfill_fails(
+        self, mock_fetch: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test a failed LetsNotMeet fetch keeps the nosleep stories."""
+        from faceless.services.scraper_service import fetch_and_process_stories
+
+        def fake_fetch(subreddit: str, limit: int) -> list[dict[str, str]]:
+            if subreddit == "LetsNotMeet":
+                raise httpx.ConnectError("connection refused")
+            return [{"title": "Nosleep One", "content": "Para one.\n\nPara two."}]
+
+        mock_fetch.side_effect = fake_fetch
+
+        result = fetch_and_process_stories(
+            "scary-stories", count=2, output_dir=tmp_path
+        )
+
+        assert [p.name for p in result] == ["nosleep-one_script.json"]
+
     @patch("faceless.services.scraper_service.fetch_reddit_stories")
     @patch("faceless.services.scraper_service.get_settings")
     def test_fetch_and_process_finance(
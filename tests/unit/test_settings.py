@@ -175,6 +175,9 @@ class TestSettings:
         assert settings.debug is False
         assert settings.output_base_dir == Path("output")
         assert settings.max_concurrent_requests == 5
+        assert settings.max_concurrent_enhancements == 8
+        assert settings.enhance_cache_dir is None
+        assert settings.tts_cache_dir is None
         assert settings.request_timeout == 120
         assert settings.enable_retry is True
         assert settings.max_retries == 3
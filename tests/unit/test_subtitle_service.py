@@ -53,6 +53,14 @@ class TestFormatTimestampSrt:
         result = format_timestamp_srt(1.123)
         assert result == "00:00:01,123"
 
+    def test_rounds_to_nearest_millisecond(self) -> None:
+        """Test float error does not truncate a timestamp by a millisecond."""
+        from faceless.services.subtitle_service import format_timestamp_srt
+
+        assert format_timestamp_srt(2.3) == "00:00:02,300"
+        assert format_timestamp_srt(1.001) == "00:00:01,001"
+        assert format_timestamp_srt(59.9996) == "00:01:00,000"
+
 
 class TestFormatTimestampVtt:
     """Tests for VTT timestamp formatting."""
@@ -71,6 +79,12 @@ class TestFormatTimestampVtt:
         result = format_timestamp_vtt(45.5)
         assert result == "00:00:45.500"
 
+    def test_rounds_to_nearest_millisecond(self) -> None:
+        """Test float error does not truncate a timestamp by a millisecond."""
+        from faceless.services.subtitle_service import format_timestamp_vtt
+
+        assert format_timestamp_vtt(2.3) == "00:00:02.300"
+
     def test_uses_period_separator(self) -> None:
         """Test that VTT uses period instead of comma."""
         from faceless.services.subtitle_service import format_timestamp_vtt
@@ -569,6 +583,26 @@ class TestGenerateAllSubtitleFormats:
         assert result["vtt"].exists()
         assert result["animated_json"].exists()
 
+    def test_parses_script_once(self, tmp_path: Path) -> None:
+        """Test the script is read once and shared by all writers."""
+        from faceless.services import subtitle_service
+
+        script_path = tmp_path / "script.json"
+        script_path.write_text(
+            json.dumps(
+                {"title": "T", "scenes": [{"scene_number": 1, "narration": "Hi"}]}
+            )
+        )
+
+        with patch.object(
+            subtitle_service, "_load_script", wraps=subtitle_service._load_script
+        ) as load:
+            subtitle_service.generate_all_subtitle_formats(
+                script_path, "scary-stories", output_dir=tmp_path
+            )
+
+        load.assert_called_once_with(script_path)
+
 
 # =============================================================================
 # Subtitle Style Tests
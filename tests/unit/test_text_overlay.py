@@ -3,6 +3,9 @@ Tests for the text_overlay module.
 Tests text overlay generation and FFmpeg filter creation.
 """
 
+import dataclasses
+from pathlib import Path
+
 import pytest
 
 from faceless.core.text_overlay import (
@@ -17,7 +20,9 @@ from faceless.core.text_overlay import (
     create_mid_video_overlay,
     create_pov_overlay,
     generate_overlay_filter_chain,
+    generate_overlay_subtitles_filter,
     overlay_to_ffmpeg_filter,
+    overlays_to_ass,
     position_to_xy,
 )
 
@@ -311,6 +316,19 @@ class TestOverlayToFfmpegFilter:
         assert "5" in filter_str
         assert "10" in filter_str
 
+    def test_preset_style_matches_equal_custom_style(self):
+        """Test cached preset options match those built for an equal style."""
+        preset = PRESET_STYLES["scary"]
+        custom = dataclasses.replace(preset)
+        assert custom is not preset
+
+        preset_filter = overlay_to_ffmpeg_filter(TextOverlay(text="Hi", style=preset))
+        custom_filter = overlay_to_ffmpeg_filter(TextOverlay(text="Hi", style=custom))
+
+        assert preset_filter == custom_filter
+        assert "shadowcolor=#330000" in preset_filter
+        assert "borderw=4" in preset_filter
+
 
 class TestGenerateOverlayFilterChain:
     """Tests for generate_overlay_filter_chain function."""
@@ -338,3 +356,78 @@ class TestGenerateOverlayFilterChain:
         assert "First" in result
         assert "Second" in result
         assert "," in result  # Should be comma-separated
+
+
+class TestOverlaysToAss:
+    """Tests for ASS subtitle generation."""
+
+    def test_one_style_per_distinct_text_style(self):
+        """Test overlays sharing a style share one ASS style line."""
+        overlays = [
+            create_hook_overlay("Hook", "scary-stories"),
+            *create_countdown_overlays(5.0, count_from=2),
+        ]
+        ass = overlays_to_ass(overlays)
+
+        assert ass.count("Style: Overlay") == 2
+        assert ass.count("Dialogue:") == 3
+        assert "PlayResX: 1080" in ass
+
+    def test_event_timing_and_alignment(self):
+        """Test events carry ASS timestamps and position alignment."""
+        overlay = create_cta_overlay("Follow!", video_duration=65.5)
+        ass = overlays_to_ass([overlay])
+
+        assert "0:01:01.50,0:01:05.50" in ass
+        assert "{\\an2}Follow!" in ass
+
+    def test_escapes_override_characters(self):
+        """Test braces and backslashes in text are not read as ASS tags."""
+        overlay = TextOverlay(text="{\\b1}50% off\\now\nLine two")
+        ass = overlays_to_ass([overlay])
+
+        assert "{\\an5}\\{\\\\b1\\}50% off\\\\now\\NLine two" in ass
+
+    def test_style_colours(self):
+        """Test colors are converted to ASS &HAABBGGRR form."""
+        ass = overlays_to_ass([create_hook_overlay("Hook", "finance")])
+        style_line = next(
+            line for line in ass.splitlines() if line.startswith("Style:")
+        )
+
+        assert "&H0000CC00" in style_line
+        assert "&H00000000" in style_line
+
+
+class TestGenerateOverlaySubtitlesFilter:
+    """Tests for generate_overlay_subtitles_filter function."""
+
+    def test_empty_list(self, tmp_path: Path):
+        """Test with empty overlay list."""
+        assert generate_overlay_subtitles_filter([], tmp_path / "o.ass") == ""
+
+    def test_single_overlay_uses_drawtext(self, tmp_path: Path):
+        """Test a single overlay stays a drawtext filter."""
+        ass_path = tmp_path / "o.ass"
+        result = generate_overlay_subtitles_filter([TextOverlay(text="Hi")], ass_path)
+
+        assert result.startswith("drawtext=")
+        assert not ass_path.exists()
+
+    def test_multiple_overlays_write_ass(self, tmp_path: Path):
+        """Test multiple overlays are rendered from one ASS file."""
+        ass_path = tmp_path / "overlays" / "o.ass"
+        overlays = [TextOverlay(text="First"), TextOverlay(text="Second")]
+        result = generate_overlay_subtitles_filter(overlays, ass_path)
+
+        assert result.startswith("subtitles=")
+        assert "Second" in ass_path.read_text(encoding="utf-8")
+
+    def test_escapes_quote_in_path(self, tmp_path: Path):
+        """Test a quote in the ASS path does not end the filter argument."""
+        ass_path = tmp_path / "it's" / "o.ass"
+        overlays = [TextOverlay(text="First"), TextOverlay(text="Second")]
+        result = generate_overlay_subtitles_filter(overlays, ass_path)
+
+        assert "it'\\''s/o.ass'" in result
+        assert ass_path.exists()
@@ -114,6 +114,17 @@ class TestGenerateThumbnailPrompt:
         # The prompt shouldn't start with "Why" or "The"
         assert isinstance(prompt, str)
 
+    def test_keeps_words_containing_fillers(self) -> None:
+        """Test that only whole filler words are removed."""
+        from faceless.services.thumbnail_service import generate_thumbnail_prompt
+
+        prompt = generate_thumbnail_prompt(
+            title="How The Theory Of Money Works",
+            niche="finance",
+        )
+
+        assert ", Theory Of Money Works," in prompt
+
     def test_concept_included(self) -> None:
         """Test that concept description is included."""
         from faceless.services.thumbnail_service import (
@@ -165,7 +176,7 @@ class TestGenerateThumbnailPrompt:
 class TestGenerateThumbnail:
     """Tests for thumbnail image generation."""
 
-    @patch("faceless.services.thumbnail_service.httpx.Client")
+    @patch("faceless.services.thumbnail_service._get_client")
     @patch("faceless.services.thumbnail_service.get_settings")
     def test_generate_thumbnail_success(
         self, mock_settings: MagicMock, mock_client_class: MagicMock, tmp_path: Path
@@ -190,8 +201,6 @@ class TestGenerateThumbnail:
 
         mock_client = MagicMock()
         mock_client.post.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
         mock_client_class.return_value = mock_client
 
         result = generate_thumbnail(
@@ -227,7 +236,7 @@ class TestGenerateThumbnail:
         assert result == existing
         assert result.read_bytes() == b"existing image"
 
-    @patch("faceless.services.thumbnail_service.httpx.Client")
+    @patch("faceless.services.thumbnail_service._get_client")
     @patch("faceless.services.thumbnail_service.get_settings")
     def test_generate_thumbnail_saves_prompt(
         self, mock_settings: MagicMock, mock_client_class: MagicMock, tmp_path: Path
@@ -249,8 +258,6 @@ class TestGenerateThumbnail:
 
         mock_client = MagicMock()
         mock_client.post.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
         mock_client_class.return_value = mock_client
 
         result = generate_thumbnail(
@@ -264,7 +271,7 @@ class TestGenerateThumbnail:
         assert prompt_file.exists()
         assert prompt_file.read_text() == "My test prompt"
 
-    @patch("faceless.services.thumbnail_service.httpx.Client")
+    @patch("faceless.services.thumbnail_service._get_client")
     @patch("faceless.services.thumbnail_service.get_settings")
     def test_generate_thumbnail_handles_url_response(
         self, mock_settings: MagicMock, mock_client_class: MagicMock, tmp_path: Path
@@ -287,15 +294,13 @@ class TestGenerateThumbnail:
         }
         mock_response1.raise_for_status = MagicMock()
 
-        # Second call gets the image
+        # Second call streams the image
         mock_response2 = MagicMock()
-        mock_response2.content = b"image bytes"
+        mock_response2.iter_bytes.return_value = [b"image ", b"bytes"]
 
         mock_client = MagicMock()
         mock_client.post.return_value = mock_response1
-        mock_client.get.return_value = mock_response2
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
+        mock_client.stream.return_value.__enter__.return_value = mock_response2
         mock_client_class.return_value = mock_client
 
         result = generate_thumbnail(
@@ -305,7 +310,18 @@ class TestGenerateThumbnail:
             output_dir=tmp_path,
         )
 
-        assert result.exists()
+        assert result.read_bytes() == b"image bytes"
+        assert not result.with_suffix(".part").exists()
+
+    def test_get_client_is_shared(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test one keep-alive client is reused across thumbnails."""
+        from faceless.services.thumbnail_service import _get_client
+
+        monkeypatch.setattr(_get_client.__self__, "_client", None)
+        with patch("faceless.clients.base.httpx.Client") as mock_client:
+            assert _get_client() is _get_client()
+
+        mock_client.assert_called_once()
 
 
 # =============================================================================
@@ -379,12 +395,13 @@ class TestGenerateThumbnailVariants:
         """Test that failures are handled gracefully."""
         from faceless.services.thumbnail_service import generate_thumbnail_variants
 
-        # First succeeds, second fails, third succeeds
-        mock_generate.side_effect = [
-            tmp_path / "thumb1.png",
-            Exception("API Error"),
-            tmp_path / "thumb3.png",
-        ]
+        # Second variant fails; variants run concurrently, so key on the name
+        def generate(prompt: str, niche: str, output_name: str, output_dir: Path):
+            if "_v2_" in output_name:
+                raise Exception("API Error")
+            return tmp_path / f"{output_name}.png"
+
+        mock_generate.side_effect = generate
 
         result = generate_thumbnail_variants(
             title="Test",
@@ -445,6 +462,18 @@ class TestCreateTextOverlayInstructions:
         assert result["text_color"] == "#FFD700"  # Gold
         assert result["outline_color"] == "#000000"
 
+    def test_unknown_niche_uses_luxury_styling(self) -> None:
+        """Test that unrecognized niches fall back to luxury styling."""
+        from faceless.services.thumbnail_service import create_text_overlay_instructions
+
+        result = create_text_overlay_instructions(
+            title="Test",
+            niche="cooking",
+        )
+
+        assert result["text_color"] == "#FFD700"
+        assert "Playfair" in result["font_style"]
+
     def test_truncates_long_titles(self) -> None:
         """Test that long titles are truncated."""
         from faceless.services.thumbnail_service import create_text_overlay_instructions
@@ -473,6 +502,27 @@ class TestCreateTextOverlayInstructions:
 
         assert result["recommended_text"] == short_title
 
+    def test_truncates_to_first_five_words(self) -> None:
+        """Test that truncation keeps exactly the first five words."""
+        from faceless.services.thumbnail_service import create_text_overlay_instructions
+
+        result = create_text_overlay_instructions(
+            title="One  two three four five six seven",
+            niche="finance",
+        )
+
+        assert result["recommended_text"] == "One two three four five..."
+
+    def test_five_word_title_not_truncated(self) -> None:
+        """Test that a title of exactly five words is kept as-is."""
+        from faceless.services.thumbnail_service import create_text_overlay_instructions
+
+        title = "One two three four five "
+
+        result = create_text_overlay_instructions(title=title, niche="finance")
+
+        assert result["recommended_text"] == title
+
     def test_includes_tips(self) -> None:
         """Test that styling tips are included."""
         from faceless.services.thumbnail_service import create_text_overlay_instructions
@@ -485,6 +535,17 @@ class TestCreateTextOverlayInstructions:
         assert "tips" in result
         assert len(result["tips"]) > 0
 
+    def test_tips_not_shared_between_calls(self) -> None:
+        """Test that mutating returned tips does not leak into later calls."""
+        from faceless.services.thumbnail_service import create_text_overlay_instructions
+
+        first = create_text_overlay_instructions(title="Test", niche="finance")
+        first["tips"].clear()
+
+        second = create_text_overlay_instructions(title="Test", niche="finance")
+
+        assert len(second["tips"]) == 4
+
     def test_includes_placement(self) -> None:
         """Test that placement guidance is included."""
         from faceless.services.thumbnail_service import create_text_overlay_instructions
@@ -31,6 +31,7 @@ class TestTTSService:
             settings.get_audio_dir.return_value = Path("/tmp/audio")
             settings.ffprobe_path = "ffprobe"
             settings.max_concurrent_tts = 5
+            settings.tts_cache_dir = None
             mock.return_value = settings
             yield settings
 
@@ -124,6 +125,58 @@ class TestTTSService:
         assert call_kwargs["voice"] == Voice.NOVA
         assert call_kwargs["speed"] == 1.2
 
+    def test_generate_for_scene_reuses_cached_audio(
+        self, tts_service, mock_client, mock_settings, sample_scene, tmp_path: Path
+    ) -> None:
+        """Test identical narration is served from the audio cache."""
+        output_dir = tmp_path / "audio"
+        output_dir.mkdir()
+        tts_service._cache_dir = tmp_path / "cache"
+        mock_settings.azure_openai.tts_deployment = "tts"
+        mock_client.save_audio.side_effect = lambda **kw: kw["output_path"].write_bytes(
+            b"mp3"
+        )
+
+        tts_service.generate_for_scene(
+            scene=sample_scene,
+            niche=Niche.SCARY_STORIES,
+            output_dir=output_dir,
+        )
+        (output_dir / "scene_01.mp3").unlink()
+        tts_service.generate_for_scene(
+            scene=sample_scene,
+            niche=Niche.SCARY_STORIES,
+            output_dir=output_dir,
+        )
+
+        mock_client.save_audio.assert_called_once()
+        assert (output_dir / "scene_01.mp3").read_bytes() == b"mp3"
+        assert len(list((tmp_path / "cache").glob("*.mp3"))) == 1
+        assert not list((tmp_path / "cache").glob("*.tmp"))
+
+    def test_cache_writers_use_separate_temp_files(
+        self, tts_service, mock_client, mock_settings, sample_scene, tmp_path: Path
+    ) -> None:
+        """Test each cache write goes through its own temporary file."""
+        output_dir = tmp_path / "audio"
+        output_dir.mkdir()
+        tts_service._cache_dir = tmp_path / "cache"
+        mock_settings.azure_openai.tts_deployment = "tts"
+        mock_client.save_audio.side_effect = lambda **kw: kw["output_path"].write_bytes(
+            b"mp3"
+        )
+
+        # Without the rename, both calls miss the cache and write a temp file
+        with patch("pathlib.Path.replace"):
+            for _ in range(2):
+                tts_service.generate_for_scene(
+                    scene=sample_scene,
+                    niche=Niche.SCARY_STORIES,
+                    output_dir=output_dir,
+                )
+
+        assert len(list((tmp_path / "cache").glob("*.tmp"))) == 2
+
     def test_generate_for_scene_error(
         self, tts_service, mock_client, sample_scene, tmp_path: Path
     ) -> None:
@@ -206,6 +259,29 @@ class TestTTSService:
         assert len(results) == 1
         assert mock_client.save_audio.call_count == 2
 
+    def test_generate_for_script_shares_duplicate_narration(
+        self, tts_service, mock_client, mock_settings, tmp_path: Path
+    ) -> None:
+        """Test scenes with identical narration are synthesized once."""
+        scenes = [
+            Scene(scene_number=1, narration="Same hook", image_prompt="Test"),
+            Scene(scene_number=2, narration="Middle", image_prompt="Test"),
+            Scene(scene_number=3, narration="Same hook", image_prompt="Test"),
+        ]
+        script = Script(title="Test", niche=Niche.FINANCE, scenes=scenes)
+        mock_settings.get_audio_dir.return_value = tmp_path / "audio"
+        mock_client.save_audio.side_effect = lambda **kw: kw["output_path"].write_bytes(
+            kw["text"].encode()
+        )
+
+        results = tts_service.generate_for_script(script=script)
+
+        assert len(results) == 3
+        assert mock_client.save_audio.call_count == 2
+        assert scenes[2].audio_path is not None
+        assert scenes[2].audio_path.name == "scene_03.mp3"
+        assert scenes[2].audio_path.read_bytes() == b"Same hook"
+
     def test_generate_for_script_updates_checkpoint(
         self, tts_service, mock_client, mock_settings, sample_script, tmp_path: Path
     ) -> None: